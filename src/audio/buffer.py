@@ -2,13 +2,10 @@
 音声バッファ管理モジュール
 チャンク分割とキュー管理
 """
-import queue
 import threading
 import time
-from typing import Optional, Callable
-import numpy as np
+from typing import Final, Optional, Callable
 from src.utils.logger import logger
-from src.audio.vad import VADProcessor
 
 
 class AudioBufferManager:
@@ -48,26 +45,57 @@ class AudioBufferManager:
         self.channels = channels
         self.on_chunk_ready = on_chunk_ready
 
+        # サンプル演算の定数を一度だけ計算（16bit = 2 bytes）
+        self._bytes_per_second: Final[int] = 2 * sample_rate * channels
+        self._min_speech_bytes: Final[int] = self._bytes_per_second  # 1秒分
+
         # チャンクサイズ（バイト数）
-        # 16bit (2 bytes) * sample_rate * channels * duration
-        self.chunk_size_bytes = 2 * sample_rate * channels * chunk_duration_sec
+        self.chunk_size_bytes: Final[int] = self._bytes_per_second * chunk_duration_sec
 
         # オーバーラップ設定
+        # 固定長バッファを事前確保し、チャンク毎の新規割り当てを避ける
         self.overlap_duration_sec = chunk_overlap_sec
-        self.overlap_size_bytes = 2 * sample_rate * channels * chunk_overlap_sec
-        self.previous_overlap = bytearray()
-
-        # バッファ
-        self.buffer = bytearray()
-        self.buffer_lock = threading.Lock()
-
-        # チャンク処理用キュー
-        self.chunk_queue = queue.Queue(maxsize=queue_maxsize)
+        self.overlap_size_bytes: Final[int] = self._bytes_per_second * chunk_overlap_sec
+        self._overlap_buf = bytearray(self.overlap_size_bytes)
+        self._overlap_len = 0  # 有効なオーバーラップ長（初回チャンクは0）
+
+        # リングバッファ（固定長を事前確保し、read/writeカーソルで管理）
+        # del buffer[:n] による残データの左シフトコピーを排除する
+        # チャンク分割はadd_audio_data内で先行するため、2チャンク分で十分
+        self._ring_capacity = self.chunk_size_bytes * 2
+        self._ring = bytearray(self._ring_capacity)
+        self._read_pos = 0   # 読み出しカーソル（絶対位置、単調増加）
+        self._write_pos = 0  # 書き込みカーソル（絶対位置、単調増加）
+
+        # チャンク受け渡し用SPSCリング
+        # 生産者（録音スレッド）と消費者（処理スレッド）が1つずつなので、
+        # GIL下でのint読み書きのアトミック性によりロックなしで受け渡せる
+        slot_count = 1
+        while slot_count < queue_maxsize:
+            slot_count <<= 1
+        self._slot_count = slot_count
+        self._slot_mask = slot_count - 1
+        self._slots = [None] * slot_count
+        self._slot_head = 0  # 生産者のみが更新
+        self._slot_tail = 0  # 消費者のみが更新（満杯時のドロップを除く）
+
+        # VAD済みチャンクをコールバックワーカーへ渡すSPSCリング
+        # VAD（〜100ms）とASRコールバック（数秒）を別スレッドで重畳させる
+        self._asr_slots = [None] * slot_count
+        self._asr_head = 0  # VADワーカーのみが更新
+        self._asr_tail = 0  # コールバックワーカーのみが更新（満杯時のドロップを除く）
+
+        # チャンクバッファプール（チャンク毎の約1MBのbytes割り当てを再利用で回避）
+        self._chunk_pool: list = []
+        self._chunk_pool_max = 4
 
         # VAD
         self.vad_enabled = vad_enabled
         self.vad_processor = None
         if vad_enabled:
+            # VAD利用時のみインポート（torch/Sileroのロードを起動時から排除）
+            from src.audio.vad import VADProcessor
+
             self.vad_processor = VADProcessor(
                 sample_rate=sample_rate,
                 aggressiveness=vad_aggressiveness
@@ -85,10 +113,15 @@ class AudioBufferManager:
         self.total_chunks_processed = 0
         self.total_chunks_skipped = 0
         self.start_time = None
+        self._start_ns: Optional[int] = None  # monotonicな録音開始時刻（ns）
 
-        # 処理スレッド
+        # 処理スレッド（VADワーカーとコールバックワーカーの2段パイプライン）
         self.processing_thread: Optional[threading.Thread] = None
+        self.callback_thread: Optional[threading.Thread] = None
         self.is_processing = False
+        self._data_event = threading.Event()  # チャンク投入時に生産者がセット
+        self._asr_event = threading.Event()   # VAD済みチャンク投入時にセット
+        self._stop_event = threading.Event()  # 停止要求時にセット
 
         logger.info(
             f"AudioBufferManager initialized: "
@@ -105,35 +138,125 @@ class AudioBufferManager:
         Args:
             audio_data: 音声データ（bytes）
         """
-        with self.buffer_lock:
-            self.buffer.extend(audio_data)
-
-            # チャンクサイズに達したら分割
-            while len(self.buffer) >= self.chunk_size_bytes:
-                # 前チャンクのオーバーラップを含める
-                chunk_with_overlap = bytes(self.previous_overlap + self.buffer[:self.chunk_size_bytes])
-
-                # 次回用のオーバーラップを保存（最後のN秒）
-                if self.overlap_size_bytes > 0:
-                    overlap_start = max(0, self.chunk_size_bytes - self.overlap_size_bytes)
-                    self.previous_overlap = self.buffer[overlap_start:self.chunk_size_bytes]
-
-                # インプレース削除でメモリコピーを削減
-                del self.buffer[:self.chunk_size_bytes]
-
-                # チャンクのタイムスタンプ（録音開始からの経過時間）
-                timestamp = self._get_current_timestamp()
-
-                try:
-                    self.chunk_queue.put_nowait((chunk_with_overlap, timestamp))
-                    logger.debug(f"Chunk added to queue: {len(chunk_with_overlap)} bytes at {timestamp:.2f}s")
-                except queue.Full:
-                    logger.warning("Chunk queue is full, dropping oldest chunk")
-                    try:
-                        self.chunk_queue.get_nowait()  # 古いチャンクを削除
-                        self.chunk_queue.put_nowait((chunk_with_overlap, timestamp))
-                    except queue.Empty:
-                        pass
+        # 最頻呼び出しメソッドのため、ホットな属性参照をローカル変数に退避
+        chunk_size = self.chunk_size_bytes
+        overlap_size = self.overlap_size_bytes
+
+        # リングへの書き込み・チャンク切り出しは録音スレッドのみが行うため
+        # ロック不要（SPSC前提）。読み取り側はintカーソルを参照するのみ
+        self._ring_write(audio_data)
+
+        # チャンクサイズに達したら分割
+        while self._write_pos - self._read_pos >= chunk_size:
+            # プールからバッファを取得し、オーバーラップ＋チャンクを直接書き込む
+            overlap_len = self._overlap_len
+            chunk_with_overlap = self._acquire_chunk_buffer(
+                overlap_len + chunk_size
+            )
+            if overlap_len:
+                chunk_with_overlap[:overlap_len] = self._overlap_buf[:overlap_len]
+            self._ring_read_into(
+                memoryview(chunk_with_overlap)[overlap_len:],
+                chunk_size
+            )
+
+            # 次回用のオーバーラップを保存（最後のN秒を固定バッファへ上書き）
+            if overlap_size > 0:
+                self._overlap_buf[:] = memoryview(chunk_with_overlap)[-overlap_size:]
+                self._overlap_len = overlap_size
+
+            # チャンクのタイムスタンプ（録音開始からの経過時間）
+            timestamp = self._get_current_timestamp()
+            self._enqueue_chunk(chunk_with_overlap, timestamp)
+
+    def _acquire_chunk_buffer(self, size: int) -> bytearray:
+        """
+        プールから指定サイズのバッファを取得（なければ新規確保）
+
+        Args:
+            size: 必要なバッファサイズ（バイト数）
+
+        Returns:
+            再利用可能なバッファ
+        """
+        pool = self._chunk_pool
+        for i, buf in enumerate(pool):
+            if len(buf) == size:
+                return pool.pop(i)
+        return bytearray(size)
+
+    def _release_chunk_buffer(self, buf) -> None:
+        """
+        使用済みチャンクバッファをプールに返却
+
+        Args:
+            buf: 返却するバッファ
+        """
+        if isinstance(buf, bytearray) and len(self._chunk_pool) < self._chunk_pool_max:
+            self._chunk_pool.append(buf)
+
+    def _enqueue_chunk(self, chunk: bytes, timestamp: float) -> None:
+        """
+        チャンクをSPSCリングに投入（満杯時は最古のチャンクを破棄）
+
+        Args:
+            chunk: 音声チャンク
+            timestamp: タイムスタンプ
+        """
+        head = self._slot_head
+        if head - self._slot_tail >= self._slot_count:
+            logger.warning("Chunk queue is full, dropping oldest chunk")
+            self._slot_tail += 1  # 最古のチャンクを破棄
+        self._slots[head & self._slot_mask] = (chunk, timestamp)
+        self._slot_head = head + 1
+        self._data_event.set()  # 消費者スレッドを起床
+        # DEBUG無効時はf-string評価ごと省く（チャンク毎に呼ばれるため）
+        logger.opt(lazy=True).debug(
+            "Chunk added to queue: {} bytes at {:.2f}s",
+            lambda: len(chunk), lambda: timestamp
+        )
+
+    def _ring_write(self, data: bytes) -> None:
+        """
+        リングバッファにデータを書き込む（録音スレッドからのみ呼ぶこと）
+
+        Args:
+            data: 書き込む音声データ
+        """
+        cap = self._ring_capacity
+        n = len(data)
+        free = cap - (self._write_pos - self._read_pos)
+        if n > free:
+            # 通常はチャンク分割が先行するため発生しないが、念のため最古データを破棄
+            logger.warning(f"Ring buffer overflow, dropping {n - free} oldest bytes")
+            self._read_pos += n - free
+
+        w = self._write_pos % cap
+        first = min(n, cap - w)
+        self._ring[w:w + first] = data[:first]
+        if first < n:
+            # ラップアラウンド：残りを先頭に書き込む
+            self._ring[:n - first] = data[first:]
+        self._write_pos += n
+
+    def _ring_read_into(self, dest: memoryview, n: int) -> None:
+        """
+        リングバッファからnバイトをdestに読み出してカーソルを進める
+        （録音スレッドからのみ呼ぶこと）
+
+        Args:
+            dest: 書き込み先（nバイト以上のmemoryview）
+            n: 読み出すバイト数
+        """
+        cap = self._ring_capacity
+        r = self._read_pos % cap
+        first = min(n, cap - r)
+        view = memoryview(self._ring)
+        dest[:first] = view[r:r + first]
+        if first < n:
+            # ラップアラウンド：残りを先頭から読み出す
+            dest[first:n] = view[:n - first]
+        self._read_pos += n
 
     def _get_current_timestamp(self) -> float:
         """
@@ -142,10 +265,14 @@ class AudioBufferManager:
         Returns:
             経過時間（秒）
         """
-        if self.start_time is None:
-            self.start_time = time.time()
+        # 壁時計（time.time）はNTP補正で飛ぶことがあるため、
+        # 経過時間の計測にはmonotonicな整数ns時刻を使う
+        if self._start_ns is None:
+            self._start_ns = time.monotonic_ns()
+            if self.start_time is None:
+                self.start_time = time.time()
             return 0.0
-        return time.time() - self.start_time
+        return (time.monotonic_ns() - self._start_ns) * 1e-9
 
     def start_processing(self) -> None:
         """チャンク処理スレッドを開始"""
@@ -154,12 +281,21 @@ class AudioBufferManager:
             return
 
         self.is_processing = True
+        self._stop_event.clear()
+        self._data_event.clear()
+        self._asr_event.clear()
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.processing_thread = threading.Thread(
-            target=self._process_chunks,
+            target=self._vad_worker,
+            daemon=True
+        )
+        self.callback_thread = threading.Thread(
+            target=self._callback_worker,
             daemon=True
         )
         self.processing_thread.start()
+        self.callback_thread.start()
         logger.info("Chunk processing started")
 
     def stop_processing(self) -> None:
@@ -168,47 +304,106 @@ class AudioBufferManager:
             return
 
         self.is_processing = False
+        self._stop_event.set()
+        self._data_event.set()  # 待機中のワーカーを即座に起床させる
+        self._asr_event.set()
         if self.processing_thread:
             self.processing_thread.join(timeout=5.0)
+        if self.callback_thread:
+            self.callback_thread.join(timeout=5.0)
         logger.info("Chunk processing stopped")
 
-    def _process_chunks(self) -> None:
-        """チャンク処理のメインループ"""
-        while self.is_processing:
+    def _vad_worker(self) -> None:
+        """VADワーカー：チャンクを取り出し発話区間を抽出してASRリングへ渡す"""
+        while not self._stop_event.is_set():
             try:
-                # タイムアウト付きでチャンクを取得
-                chunk, timestamp = self.chunk_queue.get(timeout=1.0)
+                # リングからチャンクを取得（空の場合はイベント待機）
+                tail = self._slot_tail
+                if tail == self._slot_head:
+                    self._data_event.wait(timeout=0.05)
+                    self._data_event.clear()
+                    continue
+
+                slot_index = tail & self._slot_mask
+                item = self._slots[slot_index]
+                self._slots[slot_index] = None
+                self._slot_tail = tail + 1
+
+                if item is None:
+                    # 満杯時のドロップと競合した場合はスキップ
+                    continue
+
+                chunk, timestamp = item
 
                 # VADによる発話検出と発話区間抽出
                 processed_chunk = chunk
-                should_process = True
 
                 if self.vad_enabled and self.vad_processor:
                     # 発話区間のみを抽出
                     processed_chunk = self.vad_processor.extract_speech_segments(chunk)
 
                     # 抽出結果が空、または非常に短い（1秒未満）場合はスキップ
-                    min_chunk_size = self.sample_rate * 2  # 1秒分（16000Hz * 2bytes * 1sec）
-                    if not processed_chunk or len(processed_chunk) < min_chunk_size:
-                        chunk_duration = len(processed_chunk) / (self.sample_rate * 2) if processed_chunk else 0
+                    if not processed_chunk or len(processed_chunk) < self._min_speech_bytes:
+                        chunk_duration = len(processed_chunk) / self._bytes_per_second if processed_chunk else 0
                         logger.info(f"Skipping silent/short chunk at {timestamp:.2f}s (duration: {chunk_duration:.2f}s)")
                         self.total_chunks_skipped += 1
-                        should_process = False
+                        self._release_chunk_buffer(chunk)
+                        continue
+
+                # コールバックワーカーへ渡す（元バッファは返却用に添える）
+                head = self._asr_head
+                if head - self._asr_tail >= self._slot_count:
+                    logger.warning("ASR queue is full, dropping oldest chunk")
+                    dropped = self._asr_slots[self._asr_tail & self._slot_mask]
+                    self._asr_tail += 1
+                    if dropped is not None:
+                        self._release_chunk_buffer(dropped[2])
+                self._asr_slots[head & self._slot_mask] = (processed_chunk, timestamp, chunk)
+                self._asr_head = head + 1
+                self._asr_event.set()
+
+            except Exception as e:
+                logger.error(f"Error processing chunk: {e}")
+
+    def _callback_worker(self) -> None:
+        """コールバックワーカー：VAD済みチャンクでon_chunk_readyを実行する"""
+        while not self._stop_event.is_set():
+            try:
+                tail = self._asr_tail
+                if tail == self._asr_head:
+                    self._asr_event.wait(timeout=0.05)
+                    self._asr_event.clear()
+                    continue
+
+                slot_index = tail & self._slot_mask
+                item = self._asr_slots[slot_index]
+                self._asr_slots[slot_index] = None
+                self._asr_tail = tail + 1
+
+                if item is None:
+                    continue
+
+                processed_chunk, timestamp, original_chunk = item
 
                 # コールバック関数を呼び出し（発話区間のみを送信）
-                if should_process and self.on_chunk_ready:
+                if self.on_chunk_ready:
                     try:
                         self.on_chunk_ready(processed_chunk, timestamp)
                         self.total_chunks_processed += 1
                     except Exception as e:
                         logger.error(f"Error in chunk callback: {e}")
 
-                self.chunk_queue.task_done()
+                # コールバック完了後、チャンクバッファをプールに返却。
+                # ただしVAD無効時・VAD失敗時はprocessed_chunkが元バッファ
+                # そのもので、コールバック先は転写ワーカーへ非同期に
+                # 引き渡すだけなので返却しない（返却すると次チャンクの
+                # 書き込みがアップロード中の音声を上書きしてしまう。
+                # その分は所有権ごと下流へ移り、プールは新規確保で補う）
+                if processed_chunk is not original_chunk:
+                    self._release_chunk_buffer(original_chunk)
 
-            except queue.Empty:
-                continue
             except Exception as e:
-                logger.error(f"Error processing chunk: {e}")
+                logger.error(f"Error in callback worker: {e}")
 
     def get_buffer_size(self) -> int:
         """
@@ -217,8 +412,8 @@ class AudioBufferManager:
         Returns:
             バッファサイズ（バイト数）
         """
-        with self.buffer_lock:
-            return len(self.buffer)
+        # カーソルは単調増加のintなのでロックなしで安全に読める
+        return self._write_pos - self._read_pos
 
     def get_queue_size(self) -> int:
         """
@@ -227,23 +422,26 @@ class AudioBufferManager:
         Returns:
             キューのサイズ
         """
-        return self.chunk_queue.qsize()
+        return self._slot_head - self._slot_tail
 
     def clear(self) -> None:
-        """バッファとキューをクリア"""
-        with self.buffer_lock:
-            self.buffer.clear()
+        """バッファとキューをクリア（録音停止中に呼ぶこと）"""
+        self._read_pos = 0
+        self._write_pos = 0
+        self._overlap_len = 0
 
-        while not self.chunk_queue.empty():
-            try:
-                self.chunk_queue.get_nowait()
-                self.chunk_queue.task_done()
-            except queue.Empty:
-                break
+        while self._slot_tail != self._slot_head:
+            self._slots[self._slot_tail & self._slot_mask] = None
+            self._slot_tail += 1
+
+        while self._asr_tail != self._asr_head:
+            self._asr_slots[self._asr_tail & self._slot_mask] = None
+            self._asr_tail += 1
 
         self.total_chunks_processed = 0
         self.total_chunks_skipped = 0
         self.start_time = None
+        self._start_ns = None
         logger.info("Buffer and queue cleared")
 
     def get_stats(self) -> dict:
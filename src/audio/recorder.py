@@ -206,19 +206,23 @@ class AudioRecorder:
 
     def _recording_loop(self) -> None:
         """録音ループ（スレッドで実行）"""
+        # ループ内で繰り返される属性参照をローカル変数に退避
+        read = self.stream.read
+        chunk_size = self.chunk_size
+        add_audio_data = (
+            self.buffer_manager.add_audio_data if self.buffer_manager else None
+        )
+
         while self.is_recording:
             try:
                 # PyAudioストリームから音声データを読み込み
-                audio_data = self.stream.read(
-                    self.chunk_size,
-                    exception_on_overflow=False
-                )
+                audio_data = read(chunk_size, exception_on_overflow=False)
 
-                self.total_frames_recorded += self.chunk_size
+                self.total_frames_recorded += chunk_size
 
                 # バッファマネージャに音声データを追加
-                if self.buffer_manager:
-                    self.buffer_manager.add_audio_data(audio_data)
+                if add_audio_data:
+                    add_audio_data(audio_data)
 
             except Exception as e:
                 logger.error(f"Error in recording loop: {e}")
@@ -2,34 +2,110 @@
 VAD (Voice Activity Detection) モジュール
 Silero VAD を使用した音声区間検出
 """
+import hashlib
+import os
 import numpy as np
 from typing import Optional
 from src.utils.logger import logger
 
 # グローバル変数
+# モデルは初回のVADProcessor生成時に遅延ロードする（インポート時の
+# torch初期化・torch.hub.loadによる起動ブロックとメモリ常駐を回避）
 _vad_model = None
 _vad_utils = None
-SILERO_VAD_AVAILABLE = False
-
-# 起動時にVADモデルをロード
-try:
-    import torch
-    import torchaudio
-    torch.set_num_threads(1)
-    logger.info("Loading Silero VAD model...")
-    _vad_model, _vad_utils = torch.hub.load(
-        repo_or_dir='snakers4/silero-vad',
-        model='silero_vad',
-        force_reload=False,
-        onnx=False,
-        verbose=False
+SILERO_VAD_AVAILABLE: Optional[bool] = None  # None = 未判定
+
+
+def _ensure_vad_model() -> bool:
+    """
+    Silero VADモデルを遅延ロードする（初回呼び出し時のみ実行）
+
+    Returns:
+        モデルが利用可能な場合True
+    """
+    global _vad_model, _vad_utils, SILERO_VAD_AVAILABLE
+
+    if SILERO_VAD_AVAILABLE is not None:
+        return SILERO_VAD_AVAILABLE
+
+    try:
+        import torch
+        import torchaudio
+        # VADは専用ワーカースレッドで動くため、録音スレッドと干渉しない範囲で
+        # モデル内部の行列演算を並列化させる（1コアは録音・GUI用に残す）
+        torch.set_num_threads(max(1, (os.cpu_count() or 2) - 1))
+        logger.info("Loading Silero VAD model...")
+        _vad_model, _vad_utils = torch.hub.load(
+            repo_or_dir='snakers4/silero-vad',
+            model='silero_vad',
+            force_reload=False,
+            onnx=False,
+            verbose=False
+        )
+        # 動的int8量子化を試行（CPU推論の重み帯域と行列積コストを削減）
+        # スクリプト化モデル等で未対応の場合はFP32のまま使用する
+        try:
+            _vad_model = torch.quantization.quantize_dynamic(
+                _vad_model, dtype=torch.qint8
+            )
+            logger.info("Silero VAD model quantized to int8 (dynamic)")
+        except Exception as qe:
+            logger.debug(f"Dynamic quantization unavailable, using FP32 model: {qe}")
+        # スクリプト化モデルをfreezeしてPythonディスパッチ・属性参照を削減。
+        # freezeはデフォルトでforward以外のメソッドを落とすため、
+        # get_speech_timestampsがクエリ毎に呼ぶreset_statesを明示的に残す
+        try:
+            _vad_model = torch.jit.freeze(
+                _vad_model.eval(), preserved_attrs=["reset_states"]
+            )
+            logger.debug("Silero VAD model frozen (torch.jit.freeze)")
+        except Exception as fe:
+            logger.debug(f"torch.jit.freeze unavailable: {fe}")
+        SILERO_VAD_AVAILABLE = True
+        logger.info("Silero VAD model loaded successfully")
+    except Exception as e:
+        SILERO_VAD_AVAILABLE = False
+        logger.error(f"Failed to load Silero VAD: {e}")
+        logger.warning("VAD will be disabled. Install with: pip install torch torchaudio")
+
+    return SILERO_VAD_AVAILABLE
+
+
+def _fallback_speech_ratio(
+    audio_data: bytes,
+    sample_rate: int,
+    frame_duration_ms: int = 30,
+    energy_threshold: float = 1e-4
+) -> float:
+    """
+    Sileroが使えない環境向けの簡易エネルギーVAD
+
+    フレーム毎の平均二乗パワーがしきい値を超えるフレームの割合を返す。
+    全フレームをnumpyの一括演算で処理するため、Pythonループは発生しない。
+
+    Args:
+        audio_data: 音声データ（16bit PCM）
+        sample_rate: サンプルレート（Hz）
+        frame_duration_ms: フレーム長（ms）
+        energy_threshold: 発話とみなす正規化済みパワーのしきい値
+
+    Returns:
+        発話フレームの割合（0.0-1.0）
+    """
+    audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
+    frame_samples = sample_rate * frame_duration_ms // 1000
+    num_frames = len(audio_int16) // frame_samples
+    if num_frames == 0:
+        return 1.0  # 判定不能な短さは発話扱い
+
+    frames = (
+        audio_int16[:num_frames * frame_samples]
+        .astype(np.float32)
+        .reshape(num_frames, frame_samples)
     )
-    SILERO_VAD_AVAILABLE = True
-    logger.info("Silero VAD model loaded successfully")
-except Exception as e:
-    SILERO_VAD_AVAILABLE = False
-    logger.error(f"Failed to load Silero VAD: {e}")
-    logger.warning("VAD will be disabled. Install with: pip install torch torchaudio")
+    frames *= np.float32(1.0 / 32768.0)
+    frame_power = np.mean(frames * frames, axis=1)
+    return float(np.count_nonzero(frame_power > energy_threshold)) / num_frames
 
 
 class VADProcessor:
@@ -38,6 +114,17 @@ class VADProcessor:
     音声区間の検出と無音区間のフィルタリング
     """
 
+    # エネルギーゲートしきい値（正規化済み平均二乗パワー、約-60dBFS相当）
+    # これを下回るチャンクはほぼデジタル無音とみなし、Silero推論を省略する
+    ENERGY_GATE_THRESHOLD = 1e-6
+
+    # 発話区間マージの許容間隔（ms）：これ未満の間隔で隣接する区間は結合し、
+    # 抽出時のコピー回数を減らす
+    SEGMENT_MERGE_GAP_MS = 50
+
+    # Silero非搭載時のフォールバックVADで発話と判定する最小フレーム割合
+    FALLBACK_SPEECH_RATIO = 0.1
+
     def __init__(
         self,
         sample_rate: int = 16000,
@@ -53,9 +140,14 @@ class VADProcessor:
                           Silero VADではthresholdに変換（0->0.1, 1->0.3, 2->0.5, 3->0.7）
             frame_duration_ms: フレーム長（未使用、互換性のため保持）
         """
-        if not SILERO_VAD_AVAILABLE:
-            logger.warning("Silero VAD is not available. VAD will be disabled.")
+        if not _ensure_vad_model():
+            logger.warning(
+                "Silero VAD is not available. "
+                "Falling back to a simple energy-based VAD."
+            )
             self.model = None
+            self.sample_rate = sample_rate
+            self.aggressiveness = aggressiveness
             return
 
         # Silero VADは8kまたは16kHzを推奨
@@ -74,12 +166,130 @@ class VADProcessor:
         global _vad_model
         self.model = _vad_model
 
+        # int16→float32変換用スクラッチ（呼び出し間で再利用）
+        # torchテンソルを本体とし、numpyビューをキャッシュして両面から使う
+        self._scratch_tensor = None
+        self._f32_scratch: Optional[np.ndarray] = None
+
+        # 発話タイムスタンプのキャッシュ（同一チャンクへの複数クエリで推論を共有）
+        self._timestamps_cache: dict = {}
+        self._timestamps_cache_max = 8
+
         logger.info(
             f"VADProcessor initialized: "
             f"sample_rate={sample_rate}Hz, "
             f"threshold={self.threshold} (aggressiveness={aggressiveness})"
         )
 
+    def _to_audio_tensor(self, audio_data: bytes):
+        """
+        音声bytesをfloat32のtorchテンソルに変換（スクラッチバッファを再利用）
+
+        Args:
+            audio_data: 音声データ（16bit PCM）
+
+        Returns:
+            正規化済みfloat32テンソル
+        """
+        import torch
+
+        # bytesをコピーなしでint16ビューとして参照
+        audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
+
+        # スクラッチテンソルを必要に応じて拡張し、numpyビューをキャッシュ
+        n = len(audio_int16)
+        if self._scratch_tensor is None or self._scratch_tensor.numel() < n:
+            self._scratch_tensor = torch.empty(n, dtype=torch.float32)
+            self._f32_scratch = self._scratch_tensor.numpy()
+
+        # 変換結果をスクラッチへ直接書き込む（テンソルとメモリを共有）
+        np.multiply(audio_int16, np.float32(1.0 / 32768.0), out=self._f32_scratch[:n])
+
+        return self._scratch_tensor[:n]
+
+    def _mean_power(self, num_samples: int) -> float:
+        """
+        直前に_to_audio_tensorで変換したデータの平均二乗パワーを計算
+
+        Args:
+            num_samples: サンプル数
+
+        Returns:
+            正規化済み平均二乗パワー（0.0-1.0）
+        """
+        if num_samples == 0 or self._f32_scratch is None:
+            return 0.0
+        audio_float32 = self._f32_scratch[:num_samples]
+        return float(np.dot(audio_float32, audio_float32)) / num_samples
+
+    def _speech_timestamps(
+        self,
+        audio_data: bytes,
+        min_speech_duration_ms: Optional[int] = None,
+        min_silence_duration_ms: Optional[int] = None
+    ) -> list:
+        """
+        発話タイムスタンプを取得（同一チャンク・同一パラメータの再推論をキャッシュ）
+
+        Args:
+            audio_data: 音声データ（bytes）
+            min_speech_duration_ms: 最小発話長（ms、Noneはライブラリのデフォルト）
+            min_silence_duration_ms: 最小無音長（ms、Noneはライブラリのデフォルト）
+
+        Returns:
+            発話タイムスタンプのリスト
+        """
+        global _vad_utils
+        get_speech_timestamps = _vad_utils[0]
+
+        # 全文のダイジェストで同一チャンクを識別する。
+        # チャンク長は固定で、先頭・末尾はミュート時に同一の無音になり
+        # やすいため、部分ハッシュでは別チャンク同士が衝突し、別音声の
+        # タイムスタンプを適用してしまう。sha256の計算はSilero推論に
+        # 比べれば無視できるコスト
+        key = (
+            hashlib.sha256(audio_data).digest(),
+            self.threshold,
+            min_speech_duration_ms,
+            min_silence_duration_ms,
+        )
+        cached = self._timestamps_cache.get(key)
+        if cached is not None:
+            return cached
+
+        audio_tensor = self._to_audio_tensor(audio_data)
+
+        # エネルギーゲート：ほぼ完全な無音チャンクはSilero推論を省略
+        num_samples = len(audio_data) // 2
+        if self._mean_power(num_samples) < self.ENERGY_GATE_THRESHOLD:
+            logger.debug("VAD: Energy gate classified chunk as silent")
+            speech_timestamps = []
+        else:
+            kwargs = {}
+            if min_speech_duration_ms is not None:
+                kwargs["min_speech_duration_ms"] = min_speech_duration_ms
+            if min_silence_duration_ms is not None:
+                kwargs["min_silence_duration_ms"] = min_silence_duration_ms
+
+            import torch
+
+            # inference_modeでautogradの履歴管理を完全にスキップ
+            with torch.inference_mode():
+                speech_timestamps = get_speech_timestamps(
+                    audio_tensor,
+                    self.model,
+                    sampling_rate=self.sample_rate,
+                    threshold=self.threshold,
+                    **kwargs
+                )
+
+        # FIFO方式で古いエントリを破棄
+        if len(self._timestamps_cache) >= self._timestamps_cache_max:
+            self._timestamps_cache.pop(next(iter(self._timestamps_cache)))
+        self._timestamps_cache[key] = speech_timestamps
+
+        return speech_timestamps
+
     def is_speech(self, audio_data: bytes) -> bool:
         """
         音声データに発話が含まれているか判定
@@ -91,25 +301,18 @@ class VADProcessor:
             発話が含まれている場合True
         """
         if not self.model or not SILERO_VAD_AVAILABLE:
-            return True  # VADが利用できない場合は常にTrueを返す
+            # Sileroなしでも明らかな無音チャンクは弾く（エネルギーVAD）
+            try:
+                ratio = _fallback_speech_ratio(audio_data, self.sample_rate)
+                return ratio > self.FALLBACK_SPEECH_RATIO
+            except Exception as e:
+                logger.error(f"Fallback VAD error: {e}")
+                return True
 
         try:
-            global _vad_utils
-            get_speech_timestamps = _vad_utils[0]
-
-            # bytes (int16) -> float32 numpy array -> torch tensor
-            audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-
-            import torch
-            audio_tensor = torch.from_numpy(audio_float32)
-
-            # Silero VADで発話タイムスタンプを取得
-            speech_timestamps = get_speech_timestamps(
-                audio_tensor,
-                self.model,
-                sampling_rate=self.sample_rate,
-                threshold=self.threshold,
+            # Silero VADで発話タイムスタンプを取得（キャッシュ共有）
+            speech_timestamps = self._speech_timestamps(
+                audio_data,
                 min_speech_duration_ms=100,
                 min_silence_duration_ms=100
             )
@@ -132,33 +335,23 @@ class VADProcessor:
             発話信頼度（0.0=無音, 1.0=確実に発話）
         """
         if not self.model or not SILERO_VAD_AVAILABLE:
-            return 1.0
+            # フォールバック：発話フレームの割合をそのまま信頼度として返す
+            try:
+                return _fallback_speech_ratio(audio_data, self.sample_rate)
+            except Exception as e:
+                logger.error(f"Fallback VAD error: {e}")
+                return 1.0
 
         try:
-            global _vad_utils
-            get_speech_timestamps = _vad_utils[0]
-
-            # bytes (int16) -> float32 numpy array -> torch tensor
-            audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-
-            import torch
-            audio_tensor = torch.from_numpy(audio_float32)
-
-            # 発話タイムスタンプを取得
-            speech_timestamps = get_speech_timestamps(
-                audio_tensor,
-                self.model,
-                sampling_rate=self.sample_rate,
-                threshold=self.threshold
-            )
+            # 発話タイムスタンプを取得（キャッシュ共有）
+            speech_timestamps = self._speech_timestamps(audio_data)
 
             if not speech_timestamps:
                 return 0.0
 
             # 発話区間の合計時間 / 全体の時間
             total_speech_samples = sum(ts['end'] - ts['start'] for ts in speech_timestamps)
-            total_samples = len(audio_tensor)
+            total_samples = len(audio_data) // 2
 
             if total_samples == 0:
                 return 1.0
@@ -193,7 +386,7 @@ class VADProcessor:
         Returns:
             VADが利用可能な場合True
         """
-        return SILERO_VAD_AVAILABLE and self.model is not None
+        return bool(SILERO_VAD_AVAILABLE) and self.model is not None
 
     def extract_speech_segments(self, audio_data: bytes) -> bytes:
         """
@@ -210,48 +403,44 @@ class VADProcessor:
             return audio_data
 
         try:
-            global _vad_utils
-            get_speech_timestamps = _vad_utils[0]
-
-            # bytes (int16) -> float32 numpy array -> torch tensor
-            audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-
-            import torch
-            audio_tensor = torch.from_numpy(audio_float32)
-
-            # 発話タイムスタンプを取得
-            speech_timestamps = get_speech_timestamps(
-                audio_tensor,
-                self.model,
-                sampling_rate=self.sample_rate,
-                threshold=self.threshold,
+            # 発話タイムスタンプを取得（エネルギーゲート・キャッシュ込み）
+            speech_timestamps = self._speech_timestamps(
+                audio_data,
                 min_speech_duration_ms=250,  # 最低250ms以上の発話のみ検出
                 min_silence_duration_ms=100
             )
 
-            # 早期クリーンアップ
-            del audio_tensor
-            del audio_float32
-
             if not speech_timestamps:
                 # 発話が全く検出されない場合は空のバイト列を返す
                 original_duration = len(audio_data) / (self.sample_rate * 2)
                 logger.info(f"VAD: No speech detected in {original_duration:.1f}s chunk")
                 return b''
 
-            # 発話区間のみを抽出して結合（memoryviewでゼロコピー）
+            # 近接する発話区間をマージしてコピー回数を削減
+            merge_gap_samples = self.SEGMENT_MERGE_GAP_MS * self.sample_rate // 1000
+            merged_ranges = [(speech_timestamps[0]['start'], speech_timestamps[0]['end'])]
+            for ts in speech_timestamps[1:]:
+                last_start, last_end = merged_ranges[-1]
+                if ts['start'] - last_end < merge_gap_samples:
+                    merged_ranges[-1] = (last_start, ts['end'])
+                else:
+                    merged_ranges.append((ts['start'], ts['end']))
+
+            # 発話区間の合計サイズ分を一度だけ確保し、直接書き込む
+            # （スライス→bytes→joinの二重コピーを排除）
             audio_view = memoryview(audio_data)
-            speech_segments = []
-            for ts in speech_timestamps:
-                start_sample = ts['start']
-                end_sample = ts['end']
-                # int16のインデックスに変換
+            total_bytes = sum((end - start) * 2 for start, end in merged_ranges)
+            extracted_audio = bytearray(total_bytes)
+            out_view = memoryview(extracted_audio)
+
+            offset = 0
+            for start_sample, end_sample in merged_ranges:
+                # int16のインデックスをバイト位置に変換
                 start_byte = start_sample * 2
                 end_byte = end_sample * 2
-                speech_segments.append(bytes(audio_view[start_byte:end_byte]))
-
-            extracted_audio = b''.join(speech_segments)
+                segment_len = end_byte - start_byte
+                out_view[offset:offset + segment_len] = audio_view[start_byte:end_byte]
+                offset += segment_len
 
             # ログ出力
             original_duration = len(audio_data) / (self.sample_rate * 2)
@@ -260,7 +449,7 @@ class VADProcessor:
 
             logger.info(
                 f"VAD: {extracted_duration:.1f}s speech extracted from {original_duration:.1f}s chunk "
-                f"({reduction_ratio:.1f}% reduced, {len(speech_timestamps)} segments)"
+                f"({reduction_ratio:.1f}% reduced, {len(merged_ranges)} segments)"
             )
 
             return extracted_audio
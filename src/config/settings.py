@@ -9,6 +9,12 @@ import yaml
 from dotenv import load_dotenv
 from src.utils.logger import logger
 
+# libyaml（C実装）があればそちらを使う（純Python実装の約10倍高速）
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 class Settings:
     """アプリケーション設定クラス"""
@@ -27,6 +33,11 @@ class Settings:
         self.config_file = config_file
         self.config: Dict[str, Any] = self._load_config(config_file)
 
+        # ドット記法キーで平坦化した辞書（getの高速パス）
+        # getはタイマーやチャンクコールバックから高頻度で呼ばれるため、
+        # 毎回のキー分割＋ネスト走査を1回の辞書参照に置き換える
+        self._flat_config: Dict[str, Any] = self._flatten_config(self.config)
+
         # APIキーの取得と検証
         self._load_api_keys()
 
@@ -48,7 +59,7 @@ class Settings:
             return self._get_default_config()
 
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
         return config or {}
 
@@ -95,6 +106,26 @@ class Settings:
         if not self.groq_api_key:
             logger.warning("GROQ_API_KEY not found in .env file")
 
+    def _flatten_config(self, config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """
+        ネストした設定辞書をドット記法キーの平坦な辞書に変換
+
+        Args:
+            config: 設定の辞書
+            prefix: キーの接頭辞（再帰用）
+
+        Returns:
+            平坦化された辞書（例: {"audio.sample_rate": 16000, ...}）
+        """
+        flat: Dict[str, Any] = {}
+        for key, value in config.items():
+            full_key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(self._flatten_config(value, f"{full_key}."))
+            else:
+                flat[full_key] = value
+        return flat
+
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         ドット記法で設定値を取得
@@ -106,16 +137,25 @@ class Settings:
         Returns:
             設定値
         """
-        keys = key_path.split(".")
-        value = self.config
+        value = self._flat_config.get(key_path)
+        return value if value is not None else default
 
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return default
+    def get_many(self, key_paths: list, defaults: list) -> tuple:
+        """
+        複数の設定値をまとめて取得
 
-        return value if value is not None else default
+        Args:
+            key_paths: 設定キーのパスのリスト
+            defaults: 各キーに対応するデフォルト値のリスト
+
+        Returns:
+            key_pathsと同じ順序の設定値のタプル
+        """
+        flat_get = self._flat_config.get
+        return tuple(
+            value if (value := flat_get(key_path)) is not None else default
+            for key_path, default in zip(key_paths, defaults)
+        )
 
     def save(self, config_file: Optional[str] = None) -> None:
         """
@@ -128,7 +168,12 @@ class Settings:
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(save_path, "w", encoding="utf-8") as f:
-            yaml.dump(self.config, f, allow_unicode=True, default_flow_style=False)
+            yaml.dump(
+                self.config, f,
+                Dumper=_YamlDumper,
+                allow_unicode=True,
+                default_flow_style=False
+            )
 
         logger.info(f"Settings saved to {save_path}")
 
@@ -149,6 +194,10 @@ class Settings:
             config = config[key]
 
         config[keys[-1]] = value
+
+        # 平坦化キャッシュも同期（更新は設定ダイアログ経由のみで低頻度）
+        self._flat_config = self._flatten_config(self.config)
+
         logger.debug(f"Setting updated: {key_path} = {value}")
 
     @property
@@ -4,24 +4,60 @@ customtkinterを使用したモダンなUI
 """
 import os
 import datetime
+import queue
+import re
+import threading
+import time
+import wave
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import customtkinter as ctk
-import pyperclip
 from src.utils.logger import logger
 from src.config.settings import Settings
 from src.audio.recorder import AudioRecorder
 from src.audio.buffer import AudioBufferManager
-from src.transcription.whisper_client import WhisperTranscriber
-from src.transcription.gpt4o_client import GPT4oTranscriber
 from src.locales.locale_manager import get_locale_manager
-from src.gui.settings_dialog import SettingsDialog
 from src.utils.output_formatter import OutputFormatter, TranscriptBuilder
 
 
+# DIARIZEモデルの話者ラベル検出用（モジュールロード時に一度だけコンパイル）
+_SPEAKER_RE = re.compile(r'(話者[A-Z]):')
+_SPEAKER_NAME_RE = re.compile(r'話者[A-Z]')
+
+
+# 録音言語コード→表示名（3箇所で使い回すため、毎回dictリテラルを生成しない）
+_LANG_DISPLAY = {"ja": "日本語", "zh-CN": "中文简体", "zh": "中文简体", "en": "English"}
+
+# 話者ラベルテーブル（新規話者検出時の文字列生成を回避）
+_SPEAKER_LABELS = tuple(f"話者{c}" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+@lru_cache(maxsize=128)
+def _format_elapsed(seconds: int) -> str:
+    """
+    整数秒をHH:MM:SS形式にフォーマット（結果をキャッシュ）
+
+    タイマーとチャンク処理の双方から同じ秒数で繰り返し呼ばれるため、
+    フォーマット済み文字列を使い回す。
+
+    Args:
+        seconds: 経過秒数
+
+    Returns:
+        タイムスタンプ文字列（HH:MM:SS形式）
+    """
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
 class MainWindow(ctk.CTk):
     """メインウィンドウクラス"""
 
+    # テキストボックスに保持する最大表示行数（超過分は先頭から削除）
+    MAX_DISPLAY_LINES = 5000
+
     def __init__(self, settings: Settings):
         super().__init__()
 
@@ -31,15 +67,24 @@ class MainWindow(ctk.CTk):
         self.transcriber: Optional[any] = None
 
         # 文字起こしテキストビルダー
+        # 全文はtranscript_textプロパティ経由で必要時にのみ取得する
         self.transcript_builder = TranscriptBuilder()
-        self.transcript_text = ""  # 後方互換性のため保持
         self.output_file_path: Optional[str] = None
+        self._output_fh = None  # 追記用ファイルハンドル（txt/md形式）
+        self._last_save_ts = 0.0  # 全体書き直し保存（json）のデバウンス用
+        self._save_scheduled = False
 
         # 録音状態管理
         self.is_recording = False
         self.is_paused = False
+        self._t0 = 0.0  # 録音開始時のmonotonic時刻（タイマー表示用）
+        self._last_elapsed = -1  # 最後に表示した経過秒数
+        self._timer_job: Optional[str] = None  # タイマーのafterジョブID（多重チェーン防止）
         self.test_mode = False  # テストモード
-        self.audio_buffer_for_test = bytearray()  # テストモード用音声バッファ
+        # テストモード用WAVストリーミングライター
+        # （セッション全体をメモリに保持せず、チャンク毎に直接書き込む）
+        self._wave_writer = None
+        self._wave_audio_path: Optional[Path] = None
 
         # 話者カラーマッピング（DIARIZEモデル用）
         self.speaker_colors = [
@@ -52,20 +97,89 @@ class MainWindow(ctk.CTk):
             "#14B8A6",  # Teal
             "#F97316",  # Orange-red
         ]
+        # テキスト表示のコアレッシング（50ms以内の挿入を1回の再描画にまとめる）
+        self._pending_text: list = []
+        self._flush_scheduled = False
+
         self.speaker_color_map = {}  # 話者名 -> 色のマッピング
         self.speaker_history = {}  # API話者ID → 一貫性のあるラベル
+        self._next_speaker_idx = 0  # 次に割り当てるラベル番号（履歴削除に影響されない）
         self.last_speaker = None  # 最後の話者
 
         # ローカライゼーションマネージャ
         ui_language = self.settings.get("ui.language", "ja")
         self.locale = get_locale_manager(ui_language)
 
+        # タイマー表示で毎秒組み立てるラベル接頭辞を事前結合しておく
+        # （言語切り替え時は_refresh_uiで再構築される）
+        self._duration_prefix = f"{self.locale.get('label_duration')}: "
+        self._status_prefix = f"{self.locale.get('label_status')}: "
+
+        # 文字起こしワーカー
+        # APIリクエスト（数秒かかる）をバッファマネージャのコールバックスレッド
+        # から切り離し、複数チャンクのリクエストをオーバーラップさせる。
+        # 結果はシーケンス番号で時系列順に整列してから反映する
+        self._work_q: queue.Queue = queue.Queue(maxsize=8)
+        self._seq_lock = threading.Lock()
+        self._emit_lock = threading.Lock()  # 反映処理の直列化用（_emit_result参照）
+        self._next_put_seq = 0
+        self._next_emit_seq = 0
+        self._pending_results: dict = {}
+        num_workers = max(2, (os.cpu_count() or 2) // 2)
+        self._workers = [
+            threading.Thread(target=self._transcription_worker, daemon=True)
+            for _ in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
         # UIのセットアップ
         self._setup_ui()
-        self._setup_recorder()
+        self._cache_settings()
+
+        # 録音システムの構築（PyAudio初期化・デバイス列挙）は初回描画の後に回す
+        # （customtkinterの初回ペイントを遅らせないため）
+        self.after_idle(self._setup_recorder)
 
         logger.info("MainWindow initialized")
 
+    @property
+    def transcript_text(self) -> str:
+        """
+        文字起こし全文を取得
+
+        チャンク毎に全文を再構築するとO(N^2)になるため、
+        コピー・保存など実際に必要になった時点でのみ結合する。
+        """
+        return self.transcript_builder.get_text()
+
+    def _cache_settings(self) -> None:
+        """
+        ホットパスで参照する設定値を属性にキャッシュ
+
+        チャンクコールバックやタイマーのたびにSettings.getの
+        ドット記法パース＋辞書走査を繰り返さないようにする。
+        設定は録音セッション中に変わらないため、設定保存時に再キャッシュすれば十分。
+        """
+        self._auto_save = self.settings.get("output.auto_save", True)
+        self._output_dir = self.settings.get("output.directory", "output")
+        self._file_prefix = self.settings.get("output.file_prefix", "transcript_")
+        self._output_format = self.settings.get("output.format", "txt")
+        self._model_name = self.settings.get("transcription.model", "")
+
+        # フォーマット種別に応じた整形関数を先に解決しておく
+        # （保存のたびの文字列比較チェーンを1回の属性参照に置き換える）
+        self._save_formatter = {
+            "md": OutputFormatter.format_markdown,
+            "json": OutputFormatter.format_json,
+            "txt": OutputFormatter.format_text,
+        }.get(self._output_format, OutputFormatter.format_text)
+
+        # 出力ディレクトリは起動・設定変更時に一度だけ作成しておく
+        # （録音開始クリック毎のPath生成とmkdirシステムコールを省く）
+        self._output_dir_path = Path(self._output_dir)
+        self._output_dir_path.mkdir(parents=True, exist_ok=True)
+
     def _setup_ui(self) -> None:
         """UIのセットアップ"""
         # ウィンドウ設定
@@ -77,6 +191,13 @@ class MainWindow(ctk.CTk):
         ctk.set_appearance_mode(theme)
         ctk.set_default_color_theme("blue")
 
+        # 共通フォントを一度だけ生成して使い回す
+        # （CTkFontはTkリソースを生成するため、ウィジェット毎の生成は無駄）
+        self._font_title = ctk.CTkFont(size=20, weight="bold")
+        self._font_btn_bold = ctk.CTkFont(size=14, weight="bold")
+        self._font_normal = ctk.CTkFont(size=14)
+        self._font_small = ctk.CTkFont(size=12)
+
         # グリッド設定
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -102,7 +223,7 @@ class MainWindow(ctk.CTk):
         self.title_label = ctk.CTkLabel(
             title_frame,
             text=f"📝 {self.locale.get('app_title')}",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._font_title
         )
         self.title_label.pack(side="left", padx=20, pady=10)
 
@@ -110,7 +231,7 @@ class MainWindow(ctk.CTk):
         self.language_button = ctk.CTkButton(
             title_frame,
             text=self.locale.get("btn_language"),
-            font=ctk.CTkFont(size=12),
+            font=self._font_small,
             width=80,
             height=30,
             command=self._toggle_language
@@ -126,7 +247,7 @@ class MainWindow(ctk.CTk):
 
         self.text_box = ctk.CTkTextbox(
             text_frame,
-            font=ctk.CTkFont(size=14),
+            font=self._font_normal,
             wrap="word"
         )
         self.text_box.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
@@ -147,25 +268,25 @@ class MainWindow(ctk.CTk):
         self.time_label = ctk.CTkLabel(
             status_frame,
             text=f"{self.locale.get('label_duration')}: 00:00:00",
-            font=ctk.CTkFont(size=12)
+            font=self._font_small
         )
         self.time_label.pack(side="left", padx=20)
 
         # 状態
         self.status_label = ctk.CTkLabel(
             status_frame,
-            text=f"{self.locale.get('label_status')}: {self.locale.get('status_idle')}",
-            font=ctk.CTkFont(size=12)
+            text=self._status_prefix + self.locale.get('status_idle'),
+            font=self._font_small
         )
         self.status_label.pack(side="left", padx=20)
 
         # 録音言語
         language = self.settings.get("transcription.language", "ja")
-        lang_display = {"ja": "日本語", "zh-CN": "中文简体", "zh": "中文简体", "en": "English"}.get(language, "日本語")
+        lang_display = _LANG_DISPLAY.get(language, "日本語")
         self.language_label = ctk.CTkLabel(
             status_frame,
             text=f"{self.locale.get('label_language', '言語')}: {lang_display}",
-            font=ctk.CTkFont(size=12)
+            font=self._font_small
         )
         self.language_label.pack(side="left", padx=20)
 
@@ -179,7 +300,7 @@ class MainWindow(ctk.CTk):
         self.start_button = ctk.CTkButton(
             control_frame,
             text=self.locale.get("btn_start"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_btn_bold,
             width=120,
             height=50,
             command=self._start_recording
@@ -190,7 +311,7 @@ class MainWindow(ctk.CTk):
         self.pause_button = ctk.CTkButton(
             control_frame,
             text=self.locale.get("btn_pause", "一時停止"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_btn_bold,
             width=120,
             height=50,
             command=self._pause_recording,
@@ -202,7 +323,7 @@ class MainWindow(ctk.CTk):
         self.stop_button = ctk.CTkButton(
             control_frame,
             text=self.locale.get("btn_stop"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_btn_bold,
             width=120,
             height=50,
             command=self._stop_recording,
@@ -214,7 +335,7 @@ class MainWindow(ctk.CTk):
         self.copy_button = ctk.CTkButton(
             control_frame,
             text=self.locale.get("btn_copy"),
-            font=ctk.CTkFont(size=14),
+            font=self._font_normal,
             width=100,
             height=50,
             command=self._copy_to_clipboard
@@ -225,7 +346,7 @@ class MainWindow(ctk.CTk):
         self.settings_button = ctk.CTkButton(
             control_frame,
             text=self.locale.get("btn_settings"),
-            font=ctk.CTkFont(size=14),
+            font=self._font_normal,
             width=100,
             height=50,
             command=self._open_settings
@@ -236,7 +357,7 @@ class MainWindow(ctk.CTk):
         self.test_mode_button = ctk.CTkButton(
             control_frame,
             text=self.locale.get("btn_test_mode_off", "テストモード: OFF"),
-            font=ctk.CTkFont(size=12),
+            font=self._font_small,
             width=140,
             height=50,
             command=self._toggle_test_mode,
@@ -274,8 +395,8 @@ class MainWindow(ctk.CTk):
             buffer_manager=self.buffer_manager
         )
 
-        # 文字起こしクライアントの作成
-        self._setup_transcriber()
+        # 文字起こしクライアントは初回の録音開始時に遅延生成する
+        # （_start_recording参照）
 
     def _setup_transcriber(self) -> None:
         """文字起こしクライアントのセットアップ"""
@@ -284,11 +405,15 @@ class MainWindow(ctk.CTk):
         sample_rate = self.settings.get("audio.sample_rate", 16000)
         channels = self.settings.get("audio.channels", 1)
 
+        # 選択されたバックエンドのクライアントのみ遅延インポート
+        # （openai/groqのHTTPスタックを両方ロードすると起動が遅くなるため）
         if model == "whisper-groq":
             if not self.settings.groq_api_key:
                 logger.error("Groq API key not found")
                 return
 
+            from src.transcription.whisper_client import WhisperTranscriber
+
             self.transcriber = WhisperTranscriber(
                 api_key=self.settings.groq_api_key,
                 model_name=self.settings.get("transcription.whisper.model_name",
@@ -309,6 +434,8 @@ class MainWindow(ctk.CTk):
             enable_diarization = (model == "gpt-4o-diarize")
             model_name = "gpt-4o-transcribe-diarize" if enable_diarization else "gpt-4o-transcribe"
 
+            from src.transcription.gpt4o_client import GPT4oTranscriber
+
             self.transcriber = GPT4oTranscriber(
                 api_key=self.settings.openai_api_key,
                 model_name=model_name,
@@ -328,17 +455,78 @@ class MainWindow(ctk.CTk):
             audio_chunk: 音声データ
             timestamp: タイムスタンプ
         """
-        # テストモードの場合、音声データを保存
-        if self.test_mode:
-            self.audio_buffer_for_test.extend(audio_chunk)
+        # テストモードの場合、音声データをWAVへ直接ストリーミング
+        if self.test_mode and self._wave_writer:
+            try:
+                self._wave_writer.writeframes(audio_chunk)
+            except Exception as e:
+                logger.error(f"Failed to write test audio: {e}")
 
         if not self.transcriber:
             logger.warning("Transcriber not initialized")
             return
 
-        # 文字起こし実行
-        text = self.transcriber.transcribe(audio_chunk, timestamp)
+        # ワーカーに引き渡す（このコールバックをHTTP往復でブロックしない）
+        with self._seq_lock:
+            seq = self._next_put_seq
+            self._next_put_seq += 1
+
+        try:
+            self._work_q.put((seq, audio_chunk, timestamp), timeout=1.0)
+        except queue.Full:
+            logger.warning(f"Transcription queue full, dropping chunk at {timestamp:.2f}s")
+            # 欠番を作ると後続チャンクの反映が止まるため空結果で埋める
+            self._emit_result(seq, None)
+
+    def _transcription_worker(self) -> None:
+        """文字起こしワーカーループ（スレッドで実行）"""
+        while True:
+            seq, audio_chunk, timestamp = self._work_q.get()
+            text = None
+            try:
+                text = self.transcriber.transcribe(audio_chunk, timestamp)
+            except Exception as e:
+                logger.error(f"Transcription worker error: {e}")
+            self._emit_result(seq, (text, timestamp))
+
+    def _emit_result(self, seq: int, result) -> None:
+        """
+        文字起こし結果を時系列順に反映
+
+        ワーカーの完了順はチャンク順と一致しないため、シーケンス番号が
+        揃うまでバッファリングし、連続した分だけまとめて反映する。
+
+        Args:
+            seq: チャンクのシーケンス番号
+            result: (テキスト, タイムスタンプ)のタプル（破棄された場合None）
+        """
+        # 取り出しと反映を_emit_lockで一体化して直列化する。
+        # 別々にロックすると、複数ワーカーがそれぞれ連続分を取り出した後に
+        # ロック外で並行反映し、ファイル追記やTranscriptBuilderへの追加が
+        # 順序逆転・競合するため（_seq_lockは辞書保護のみ）
+        with self._emit_lock:
+            ready = []
+            with self._seq_lock:
+                self._pending_results[seq] = result
+                while self._next_emit_seq in self._pending_results:
+                    ready.append(self._pending_results.pop(self._next_emit_seq))
+                    self._next_emit_seq += 1
+
+            for item in ready:
+                if item is None:
+                    continue
+                text, timestamp = item
+                if text:
+                    self._handle_transcription(text, timestamp)
+
+    def _handle_transcription(self, text: str, timestamp: float) -> None:
+        """
+        文字起こし結果をUI・ファイルに反映
 
+        Args:
+            text: 文字起こしテキスト
+            timestamp: タイムスタンプ
+        """
         if text:
             # 非常に短いテキスト（3文字未満）は無視（ノイズの可能性）
             if len(text.strip()) < 3:
@@ -351,12 +539,9 @@ class MainWindow(ctk.CTk):
             # TranscriptBuilderにチャンクを追加
             self.transcript_builder.add_chunk(text, timestamp)
 
-            # 後方互換性のため
-            self.transcript_text = self.transcript_builder.get_text()
-
             # UIを更新（メインスレッドで実行）
-            # 既存のテキストがある場合はスペースを追加
-            if self.transcript_text and self.transcript_text != text:
+            # 2チャンク目以降はスペースを挟んで連結する
+            if len(self.transcript_builder.get_chunks()) > 1:
                 formatted_text = " " + text
             else:
                 formatted_text = text
@@ -364,68 +549,113 @@ class MainWindow(ctk.CTk):
             self.after(0, self._update_text_display, formatted_text)
 
             # ファイルに自動保存
-            if self.settings.get("output.auto_save", True):
-                self._save_to_file()
+            # txt/mdは開きっぱなしのハンドルへ差分のみ追記（全体書き直しを回避）
+            # jsonは構造上追記できないため従来どおり全体を書き直す
+            if self._auto_save:
+                if self._output_fh:
+                    try:
+                        self._output_fh.write(formatted_text)
+                    except Exception as e:
+                        logger.error(f"Failed to append transcript: {e}")
+                else:
+                    # 全体書き直しになる形式（json）は3秒デバウンスして
+                    # チャンク毎のO(全文)フォーマット＋書き込みを抑える
+                    now = time.monotonic()
+                    if now - self._last_save_ts >= 3.0:
+                        self._last_save_ts = now
+                        self._save_to_file()
+                    elif not self._save_scheduled:
+                        self._save_scheduled = True
+                        self.after(3000, self._deferred_save)
+
+    def _deferred_save(self) -> None:
+        """デバウンスされた全体書き直し保存（json形式用）"""
+        self._save_scheduled = False
+        self._last_save_ts = time.monotonic()
+        self._save_to_file()
 
     def _format_timestamp(self, seconds: float) -> str:
         """タイムスタンプをフォーマット"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _format_elapsed(int(seconds))
 
     def _update_text_display(self, text: str) -> None:
-        """テキスト表示を更新（話者名は色付き）"""
-        import re
-
-        # DIARIZEモデルの出力パターンを検出: 話者A: テキスト
-        speaker_pattern = r'(話者[A-Z]):'
-
-        # 話者変更を検出
-        current_speaker = None
-        match = re.search(speaker_pattern, text)
-        if match:
-            current_speaker = match.group(1)
-
-            if self.last_speaker and self.last_speaker != current_speaker:
-                # 話者が変わった - 視覚的セパレータを追加
-                self.text_box.insert("end", "\n---\n", "speaker_change")
+        """
+        テキスト表示を更新（メインスレッドで実行）
 
-            self.last_speaker = current_speaker
+        CTkTextboxの挿入・スクロールは再描画を伴い高コストのため、
+        短時間に連続して届いたテキストは50msのウィンドウでまとめて
+        1回のフラッシュで反映する。
+        """
+        self._pending_text.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(50, self._flush_text_display)
+
+    def _flush_text_display(self) -> None:
+        """保留中のテキストをまとめて挿入し、1回だけスクロールする"""
+        pending = self._pending_text
+        self._pending_text = []
+        self._flush_scheduled = False
+
+        for text in pending:
+            self._insert_colored_text(text)
+
+        if pending:
+            # 表示行数に上限を設ける（長時間セッションでの描画・メモリ劣化対策）
+            # 全文はTranscriptBuilder／出力ファイル側に保持されているため、
+            # 画面からは古い行を消しても失われない
+            line_count = int(self.text_box.index("end-1c").split(".")[0])
+            if line_count > self.MAX_DISPLAY_LINES:
+                self.text_box.delete(
+                    "1.0", f"{line_count - self.MAX_DISPLAY_LINES + 1}.0"
+                )
 
-        if re.search(speaker_pattern, text):
-            # 話者名が含まれている場合、色付きで表示
-            parts = re.split(speaker_pattern, text)
+            self.text_box.see("end")  # 自動スクロール
 
-            for i, part in enumerate(parts):
-                if re.match(r'話者[A-Z]', part):
-                    # 話者名の場合、色を割り当てて表示
-                    if part not in self.speaker_color_map:
-                        color_index = len(self.speaker_color_map) % len(self.speaker_colors)
-                        self.speaker_color_map[part] = self.speaker_colors[color_index]
+    def _insert_colored_text(self, text: str) -> None:
+        """テキストを挿入（話者名は色付き）"""
+        # 1回のsplitで話者の有無と構造を同時に判定する
+        # （search→split→matchと3回テキストを走査していたのを1回に削減）
+        parts = _SPEAKER_RE.split(text)
 
-                    color = self.speaker_color_map[part]
+        if len(parts) == 1:
+            # 通常のテキスト（話者なし）
+            self.text_box.insert("end", text)
+            return
 
-                    # タグを作成（まだ作成されていない場合）
-                    tag_name = f"speaker_{part}"
+        # 奇数インデックスが話者名。最初の話者で話者変更を検出
+        current_speaker = parts[1]
+
+        # Tk Textのinsertは (chars, tags, chars, tags, ...) の複数指定に対応
+        # しているため、チャンク全体を1回のTcl呼び出しで挿入する
+        # （セグメント毎のindex→insert→index→tag_addの往復を排除）
+        args = []
+        if self.last_speaker and self.last_speaker != current_speaker:
+            # 話者が変わった - 視覚的セパレータを追加
+            args += ["\n---\n", ("speaker_change",)]
+        self.last_speaker = current_speaker
+
+        for i, part in enumerate(parts):
+            if i % 2 == 1:
+                # 新しい話者のときだけ色を割り当ててタグを作成
+                # （既存タグへのtag_configはTclラウンドトリップの無駄）
+                if part not in self.speaker_color_map:
+                    color_index = len(self.speaker_color_map) % len(self.speaker_colors)
+                    color = self.speaker_colors[color_index]
+                    self.speaker_color_map[part] = color
                     try:
-                        self.text_box.tag_config(tag_name, foreground=color, font=("", 14, "bold"))
+                        self.text_box.tag_config(f"speaker_{part}", foreground=color, font=("", 14, "bold"))
                     except:
                         pass
 
-                    # 話者名を色付きで挿入
-                    start_index = self.text_box.index("end-1c")
-                    self.text_box.insert("end", part)
-                    end_index = self.text_box.index("end-1c")
-                    self.text_box.tag_add(tag_name, start_index, end_index)
-                else:
-                    # 通常のテキスト
-                    self.text_box.insert("end", part)
-        else:
-            # 通常のテキスト（話者なし）
-            self.text_box.insert("end", text)
+                # 話者名は色付きタグを指定して挿入
+                args += [part, (f"speaker_{part}",)]
+            elif part:
+                # 通常のテキスト
+                args += [part, ()]
 
-        self.text_box.see("end")  # 自動スクロール
+        if args:
+            self.text_box._textbox.insert("end", *args)
 
     def _track_speaker(self, speaker_label: str) -> str:
         """
@@ -439,13 +669,14 @@ class MainWindow(ctk.CTk):
         """
         if speaker_label not in self.speaker_history:
             # 新しい話者 - 次の利用可能なラベルを割り当て
-            existing_count = len(self.speaker_history)
-            labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-
-            if existing_count < len(labels):
-                consistent_label = f"話者{labels[existing_count]}"
+            # （len(speaker_history)ではなくカウンタを使うことで、
+            #   将来履歴を整理してもラベルの重複割り当てが起きない）
+            idx = self._next_speaker_idx
+            if idx < len(_SPEAKER_LABELS):
+                consistent_label = _SPEAKER_LABELS[idx]
             else:
-                consistent_label = f"話者{existing_count + 1}"
+                consistent_label = f"話者{idx + 1}"
+            self._next_speaker_idx = idx + 1
 
             self.speaker_history[speaker_label] = consistent_label
             logger.info(f"New speaker detected: {speaker_label} -> {consistent_label}")
@@ -455,6 +686,12 @@ class MainWindow(ctk.CTk):
     def _start_recording(self) -> None:
         """録音開始または再開"""
         try:
+            # after_idle前のクリックや設定変更後に備えて遅延初期化
+            if self.recorder is None:
+                self._setup_recorder()
+            if self.transcriber is None:
+                self._setup_transcriber()
+
             # 一時停止から再開の場合
             if self.is_paused:
                 self.is_paused = False
@@ -462,41 +699,46 @@ class MainWindow(ctk.CTk):
 
                 # 録音再開
                 self.recorder.start_recording()
+                self._t0 = time.monotonic()
+                self._last_elapsed = -1
 
                 # UIの更新
                 self.start_button.configure(state="disabled")
                 self.pause_button.configure(state="normal", text=self.locale.get("btn_pause", "一時停止"))
                 self.stop_button.configure(state="normal")
                 self.status_label.configure(
-                    text=f"{self.locale.get('label_status')}: {self.locale.get('status_recording')}"
+                    text=self._status_prefix + self.locale.get('status_recording')
                 )
 
-                # タイマー再開
+                # タイマー再開（既存のチェーンが残っていれば破棄）
+                self._cancel_timer()
                 self._update_timer()
 
                 logger.info("Recording resumed")
 
             # 新規開始の場合
             else:
-                # テストモード用バッファをクリア
-                if self.test_mode:
-                    self.audio_buffer_for_test.clear()
-
                 # TranscriptBuilderをクリア
                 self.transcript_builder.clear()
-                self.transcript_text = ""
                 self.text_box.delete("1.0", "end")
 
                 # 話者カラーマッピングをクリア
                 self.speaker_color_map.clear()
                 self.speaker_history.clear()
+                self._next_speaker_idx = 0
                 self.last_speaker = None
 
                 # 出力ファイルの準備
                 self._prepare_output_file()
 
+                # テストモードの場合、WAVライターを開く
+                if self.test_mode:
+                    self._open_wave_writer()
+
                 # 録音開始
                 self.recorder.start_recording()
+                self._t0 = time.monotonic()
+                self._last_elapsed = -1
                 self.is_recording = True
                 self.is_paused = False
 
@@ -505,10 +747,11 @@ class MainWindow(ctk.CTk):
                 self.pause_button.configure(state="normal")
                 self.stop_button.configure(state="normal")
                 self.status_label.configure(
-                    text=f"{self.locale.get('label_status')}: {self.locale.get('status_recording')}"
+                    text=self._status_prefix + self.locale.get('status_recording')
                 )
 
-                # タイマー開始
+                # タイマー開始（既存のチェーンが残っていれば破棄）
+                self._cancel_timer()
                 self._update_timer()
 
                 logger.info("Recording started")
@@ -516,7 +759,7 @@ class MainWindow(ctk.CTk):
         except Exception as e:
             logger.error(f"Failed to start recording: {e}")
             self.status_label.configure(
-                text=f"{self.locale.get('label_status')}: {self.locale.get('error_recording_failed')}"
+                text=self._status_prefix + self.locale.get('error_recording_failed')
             )
 
     def _pause_recording(self) -> None:
@@ -526,13 +769,14 @@ class MainWindow(ctk.CTk):
             self.recorder.stop_recording()
             self.is_paused = True
             self.is_recording = False
+            self._cancel_timer()
 
             # UIの更新
             self.start_button.configure(state="normal", text=self.locale.get("btn_resume", "再開"))
             self.pause_button.configure(state="disabled")
             self.stop_button.configure(state="normal")
             self.status_label.configure(
-                text=f"{self.locale.get('label_status')}: {self.locale.get('status_paused', '一時停止中')}"
+                text=self._status_prefix + self.locale.get('status_paused', '一時停止中')
             )
 
             logger.info("Recording paused")
@@ -547,17 +791,24 @@ class MainWindow(ctk.CTk):
             self.recorder.stop_recording()
             self.is_recording = False
             self.is_paused = False
+            self._cancel_timer()
+
+            # テストモードの場合、音声ファイルを閉じる
+            self._close_wave_writer()
+
+            # 追記用ファイルハンドルを閉じる
+            self._close_output_file()
 
-            # テストモードの場合、音声ファイルを保存
-            if self.test_mode and len(self.audio_buffer_for_test) > 0:
-                self._save_audio_file()
+            # デバウンス中の保存が残らないよう、全体書き直し形式は最後に確定保存
+            if self._auto_save and self._output_format == "json":
+                self._save_to_file()
 
             # UIの更新
             self.start_button.configure(state="normal", text=self.locale.get("btn_start"))
             self.pause_button.configure(state="disabled")
             self.stop_button.configure(state="disabled")
             self.status_label.configure(
-                text=f"{self.locale.get('label_status')}: {self.locale.get('status_idle')}"
+                text=self._status_prefix + self.locale.get('status_idle')
             )
 
             logger.info("Recording stopped")
@@ -568,39 +819,80 @@ class MainWindow(ctk.CTk):
     def _update_timer(self) -> None:
         """タイマー更新"""
         if self.recorder and self.recorder.is_recording:
-            elapsed = self.recorder.get_elapsed_time()
-            time_str = self._format_timestamp(elapsed)
-            self.time_label.configure(text=f"{self.locale.get('label_duration')}: {time_str}")
+            # monotonic差分から整数秒を計算し、表示秒が進んだときだけ
+            # ラベルを再構成する（不要なTk configure呼び出しを回避）
+            elapsed = int(time.monotonic() - self._t0)
+            if elapsed != self._last_elapsed:
+                self._last_elapsed = elapsed
+                time_str = self._format_timestamp(elapsed)
+                self.time_label.configure(text=self._duration_prefix + time_str)
+
+            # 次の秒境界に合わせて再スケジュール
+            # （固定1000msだとドリフトして同じ秒内で二重に発火しうる）
+            delay_ms = 1000 - int(((time.monotonic() - self._t0) * 1000) % 1000)
+            self._timer_job = self.after(delay_ms, self._update_timer)
+        else:
+            self._timer_job = None
 
-            # 1秒後に再度更新
-            self.after(1000, self._update_timer)
+    def _cancel_timer(self) -> None:
+        """タイマーのafterジョブをキャンセル（停止⇄再開の連打で二重チェーンになるのを防ぐ）"""
+        if self._timer_job is not None:
+            self.after_cancel(self._timer_job)
+            self._timer_job = None
 
     def _prepare_output_file(self) -> None:
         """出力ファイルの準備"""
-        output_dir = Path(self.settings.get("output.directory", "output"))
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         # ファイル名: transcript_YYYYMMDD_HHMMSS.txt
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        prefix = self.settings.get("output.file_prefix", "transcript_")
-        format_ext = self.settings.get("output.format", "txt")
+        filename = f"{self._file_prefix}{timestamp}.{self._output_format}"
+        self.output_file_path = str(self._output_dir_path / filename)
+
+        # txt/mdはファイルを一度だけ開いてヘッダを先に書き込み、
+        # 以降はチャンク毎に差分のみ追記する（録音が長引くほど全体書き直しは
+        # O(N^2)の書き込み量になるため）。録音時間はヘッダに含められない
+        self._close_output_file()
+        if self._output_format in ("txt", "md"):
+            date_str = datetime.datetime.now().strftime('%Y年%m月%d日 %H:%M')
+            if self._output_format == "md":
+                header = f"# 議事録\n\n**日時**: {date_str}\n\n"
+                if self._model_name:
+                    header += f"**文字起こしモデル**: {self._model_name}\n\n"
+                header += "---\n\n## 内容\n\n"
+            else:
+                header = f"# 議事録 - {date_str}\n\n"
 
-        filename = f"{prefix}{timestamp}.{format_ext}"
-        self.output_file_path = str(output_dir / filename)
+            try:
+                # 行バッファリングで書き込み毎のflushコストを抑えつつ耐クラッシュ性を確保
+                self._output_fh = open(
+                    self.output_file_path, "a", encoding="utf-8", buffering=1
+                )
+                self._output_fh.write(header)
+            except Exception as e:
+                logger.error(f"Failed to open output file: {e}")
+                self._output_fh = None
 
         logger.info(f"Output file: {self.output_file_path}")
 
+    def _close_output_file(self) -> None:
+        """追記用ファイルハンドルを閉じる"""
+        if self._output_fh:
+            try:
+                self._output_fh.close()
+            except Exception as e:
+                logger.error(f"Failed to close output file: {e}")
+            self._output_fh = None
+
     def _save_to_file(self) -> None:
         """ファイルに保存"""
         if not self.output_file_path:
             return
 
         try:
-            # 設定から出力フォーマットを取得
-            format_type = self.settings.get("output.format", "txt")
+            # キャッシュ済みの出力フォーマットを使用
+            format_type = self._output_format
 
             # メタデータを作成
-            model_name = self.settings.get("transcription.model", "")
+            model_name = self._model_name
             elapsed = self.recorder.get_elapsed_time() if self.recorder else 0
             duration = self._format_timestamp(elapsed)
 
@@ -610,16 +902,14 @@ class MainWindow(ctk.CTk):
                 duration=duration
             )
 
-            # フォーマットに応じて内容を整形
+            # フォーマットに応じて内容を整形（整形関数は解決済み）
             text = self.transcript_builder.get_text()
 
-            if format_type == "md":
-                content = OutputFormatter.format_markdown(text, metadata)
-            elif format_type == "json":
+            if self._save_formatter is OutputFormatter.format_json:
                 chunks = self.transcript_builder.get_chunks()
-                content = OutputFormatter.format_json(text, metadata, chunks)
-            else:  # txt
-                content = OutputFormatter.format_text(text, metadata)
+                content = self._save_formatter(text, metadata, chunks)
+            else:
+                content = self._save_formatter(text, metadata)
 
             # ファイルに保存
             OutputFormatter.save_file(self.output_file_path, content, format_type)
@@ -631,7 +921,12 @@ class MainWindow(ctk.CTk):
         """クリップボードにコピー"""
         try:
             if self.transcript_text:
-                pyperclip.copy(self.transcript_text)
+                # Tk自身のクリップボードを直接使う
+                # （pyperclipはサブプロセス起動/COM呼び出しを伴い、
+                #   長文コピー時にUIをブロックすることがある）
+                self.clipboard_clear()
+                self.clipboard_append(self.transcript_text)
+                self.update()  # クリップボード内容を即時反映
                 logger.info(self.locale.get("message_copied"))
                 # 一時的に通知を表示
                 original_text = self.copy_button.cget("text")
@@ -650,7 +945,9 @@ class MainWindow(ctk.CTk):
             logger.warning("Cannot change settings while recording")
             return
 
-        # 設定ダイアログを開く
+        # 設定ダイアログを開く（ボタンクリック時のみ必要なため遅延インポート）
+        from src.gui.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self, self.settings, on_save=self._on_settings_saved)
         self.wait_window(dialog)
 
@@ -666,9 +963,15 @@ class MainWindow(ctk.CTk):
         # 録音システムを再セットアップ
         self._setup_recorder()
 
+        # 文字起こしクライアントは次回録音開始時に新しい設定で再生成
+        self.transcriber = None
+
+        # 設定が変わったのでホットパス用キャッシュも更新
+        self._cache_settings()
+
         # 言語ラベルを更新
         language = self.settings.get("transcription.language", "ja")
-        lang_display = {"ja": "日本語", "zh": "中文", "en": "English"}.get(language, "日本語")
+        lang_display = _LANG_DISPLAY.get(language, "日本語")
         self.language_label.configure(text=f"{self.locale.get('label_language', '言語')}: {lang_display}")
 
         logger.info("Recorder system reinitialized")
@@ -703,13 +1006,9 @@ class MainWindow(ctk.CTk):
             )
             logger.info("Test mode disabled")
 
-    def _save_audio_file(self) -> None:
-        """テストモード用の音声ファイルを保存"""
+    def _open_wave_writer(self) -> None:
+        """テストモード用のWAVファイルをストリーミング書き込みで開く"""
         try:
-            import wave
-            import datetime
-            from pathlib import Path
-
             # output/devディレクトリを作成
             dev_dir = Path("output/dev")
             dev_dir.mkdir(parents=True, exist_ok=True)
@@ -719,36 +1018,62 @@ class MainWindow(ctk.CTk):
                 # transcriptファイル名からタイムスタンプを抽出
                 transcript_name = Path(self.output_file_path).stem
                 timestamp = transcript_name.replace("transcript_", "")
-                audio_filename = f"audio_{timestamp}.wav"
             else:
                 # フォールバック
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                audio_filename = f"audio_{timestamp}.wav"
 
-            audio_path = dev_dir / audio_filename
+            self._wave_audio_path = dev_dir / f"audio_{timestamp}.wav"
+
+            # チャンク毎にwriteframesで追記する（セッション全体をRAMに持たない）
+            self._wave_writer = wave.open(str(self._wave_audio_path), 'wb')
+            self._wave_writer.setnchannels(1)  # モノラル
+            self._wave_writer.setsampwidth(2)  # 16-bit
+            self._wave_writer.setframerate(self.settings.get("audio.sample_rate", 16000))
 
-            # WAVファイルとして保存
-            with wave.open(str(audio_path), 'wb') as wav_file:
-                wav_file.setnchannels(1)  # モノラル
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(self.settings.get("audio.sample_rate", 16000))
-                wav_file.writeframes(bytes(self.audio_buffer_for_test))
+            logger.info(f"Test audio streaming to: {self._wave_audio_path}")
 
-            logger.info(f"Test audio saved to: {audio_path}")
+        except Exception as e:
+            logger.error(f"Failed to open audio file: {e}")
+            self._wave_writer = None
+
+    def _close_wave_writer(self) -> None:
+        """テストモード用のWAVファイルを閉じる"""
+        if self._wave_writer is None:
+            return
 
+        try:
+            self._wave_writer.close()
+            logger.info(f"Test audio saved to: {self._wave_audio_path}")
         except Exception as e:
-            logger.error(f"Failed to save audio file: {e}")
+            logger.error(f"Failed to close audio file: {e}")
+        finally:
+            self._wave_writer = None
+
+    @staticmethod
+    def _set_text(widget, text: str) -> None:
+        """
+        テキストが変わったときだけconfigureを呼ぶ
+
+        CTkウィジェットは同一テキストでもconfigureで再描画が走るため、
+        変更の有無を先に比較して無駄なキャンバス再描画を避ける。
+        """
+        if widget.cget("text") != text:
+            widget.configure(text=text)
 
     def _refresh_ui(self) -> None:
         """UIテキストを再読み込み"""
+        # タイマー・ステータス用の接頭辞を現在の言語で再構築
+        self._duration_prefix = f"{self.locale.get('label_duration')}: "
+        self._status_prefix = f"{self.locale.get('label_status')}: "
+
         # ウィンドウタイトル
         self.title(self.locale.get("app_title"))
 
         # タイトルラベル
-        self.title_label.configure(text=f"📝 {self.locale.get('app_title')}")
+        self._set_text(self.title_label, f"📝 {self.locale.get('app_title')}")
 
         # 言語ボタン
-        self.language_button.configure(text=self.locale.get("btn_language"))
+        self._set_text(self.language_button, self.locale.get("btn_language"))
 
         # ステータスバー
         if self.recorder and self.recorder.is_recording:
@@ -758,27 +1083,27 @@ class MainWindow(ctk.CTk):
 
         elapsed = self.recorder.get_elapsed_time() if self.recorder else 0
         time_str = self._format_timestamp(elapsed)
-        self.time_label.configure(text=f"{self.locale.get('label_duration')}: {time_str}")
-        self.status_label.configure(text=f"{self.locale.get('label_status')}: {status_text}")
+        self._set_text(self.time_label, self._duration_prefix + time_str)
+        self._set_text(self.status_label, self._status_prefix + status_text)
 
         # 録音言語
         language = self.settings.get("transcription.language", "ja")
-        lang_display = {"ja": "日本語", "zh-CN": "中文简体", "zh": "中文简体", "en": "English"}.get(language, "日本語")
-        self.language_label.configure(text=f"{self.locale.get('label_language', '言語')}: {lang_display}")
+        lang_display = _LANG_DISPLAY.get(language, "日本語")
+        self._set_text(self.language_label, f"{self.locale.get('label_language', '言語')}: {lang_display}")
 
         # ボタン
         if self.is_paused:
-            self.start_button.configure(text=self.locale.get("btn_resume"))
+            self._set_text(self.start_button, self.locale.get("btn_resume"))
         else:
-            self.start_button.configure(text=self.locale.get("btn_start"))
-        self.pause_button.configure(text=self.locale.get("btn_pause"))
-        self.stop_button.configure(text=self.locale.get("btn_stop"))
-        self.copy_button.configure(text=self.locale.get("btn_copy"))
-        self.settings_button.configure(text=self.locale.get("btn_settings"))
+            self._set_text(self.start_button, self.locale.get("btn_start"))
+        self._set_text(self.pause_button, self.locale.get("btn_pause"))
+        self._set_text(self.stop_button, self.locale.get("btn_stop"))
+        self._set_text(self.copy_button, self.locale.get("btn_copy"))
+        self._set_text(self.settings_button, self.locale.get("btn_settings"))
         if self.test_mode:
-            self.test_mode_button.configure(text=self.locale.get("btn_test_mode_on"))
+            self._set_text(self.test_mode_button, self.locale.get("btn_test_mode_on"))
         else:
-            self.test_mode_button.configure(text=self.locale.get("btn_test_mode_off"))
+            self._set_text(self.test_mode_button, self.locale.get("btn_test_mode_off"))
 
     def cleanup(self) -> None:
         """クリーンアップ"""
@@ -787,9 +1112,35 @@ class MainWindow(ctk.CTk):
         logger.info("MainWindow cleaned up")
 
     def on_closing(self) -> None:
-        """ウィンドウクローズ時の処理"""
-        if self.recorder and self.recorder.is_recording:
-            self.recorder.stop_recording()
+        """
+        ウィンドウクローズ時の処理
+
+        録音停止はスレッドjoinを伴いUIスレッドを数秒ブロックしうるため、
+        シャットダウンはバックグラウンドで実行し、完了後にウィンドウを破棄する。
+        """
+        # 多重クローズを防止
+        if getattr(self, "_closing", False):
+            return
+        self._closing = True
+
+        # 操作を無効化
+        for button in (self.start_button, self.pause_button, self.stop_button,
+                       self.copy_button, self.settings_button, self.test_mode_button):
+            button.configure(state="disabled")
+
+        threading.Thread(target=self._shutdown_worker, daemon=True).start()
 
-        self.cleanup()
-        self.destroy()
+    def _shutdown_worker(self) -> None:
+        """録音停止とリソース解放をUIスレッド外で実行（スレッドで実行）"""
+        try:
+            if self.recorder and self.recorder.is_recording:
+                self.recorder.stop_recording()
+
+            self._close_wave_writer()
+            self._close_output_file()
+            self.cleanup()
+        except Exception as e:
+            logger.error(f"Shutdown error: {e}")
+        finally:
+            # ウィンドウ破棄はメインスレッドで実行
+            self.after(0, self.destroy)
@@ -11,6 +11,33 @@ from src.utils.logger import logger
 class SettingsDialog(ctk.CTkToplevel):
     """設定ダイアログクラス"""
 
+    # 内部キー⇄表示名の変換表（読み込みと保存の双方で使い回す）
+    _MODEL_FWD = {
+        "whisper-groq": "Whisper (Groq)",
+        "gpt-4o-transcribe": "gpt-4o-transcribe",
+        "gpt-4o-diarize": "gpt-4o-diarize",
+    }
+    _MODEL_REV = {v: k for k, v in _MODEL_FWD.items()}
+    _LANG_FWD = {
+        "ja": "日本語 (ja)",
+        "zh-CN": "中文简体 (zh-CN)",
+        "zh": "中文简体 (zh-CN)",  # 後方互換性
+        "en": "English (en)",
+    }
+    # zhとzh-CNが同じ表示名を共有するため、逆引きは明示的に定義する
+    _LANG_REV = {
+        "日本語 (ja)": "ja",
+        "中文简体 (zh-CN)": "zh-CN",
+        "English (en)": "en",
+    }
+
+    # VAD感度値→翻訳キー（スライダードラッグ毎のdict生成を避ける）
+    _VAD_LABELS = (
+        "settings_sensitivity_low",
+        "settings_sensitivity_medium",
+        "settings_sensitivity_high",
+    )
+
     def __init__(self, parent, settings: Settings, on_save: Optional[Callable] = None):
         """
         設定ダイアログの初期化
@@ -38,11 +65,17 @@ class SettingsDialog(ctk.CTkToplevel):
         # 設定値の一時保存用
         self.temp_settings = {}
 
+        # 共有フォント（セクション毎にCTkFontを生成しない。
+        # Tk側でフォントは参照カウント管理されるため使い回しが効く）
+        self._section_font = ctk.CTkFont(size=14, weight="bold")
+        self._info_font = ctk.CTkFont(size=12)
+
         # UIのセットアップ
         self._setup_ui()
 
-        # 現在の設定値を読み込み
-        self._load_current_settings()
+        # 現在の設定値の反映はウィンドウ表示後の最初のアイドルまで遅延
+        # （ダイアログを即座にマップし、体感の開き遅延を減らす）
+        self.after_idle(self._load_current_settings)
 
     def _setup_ui(self) -> None:
         """UIのセットアップ"""
@@ -68,29 +101,31 @@ class SettingsDialog(ctk.CTkToplevel):
     def _create_audio_section(self, parent) -> None:
         """音声設定セクション"""
         # 音声設定セクションは削除（システムデフォルトデバイスを使用）
+        _t = self.locale.get  # 属性参照をローカルに束縛
         # セクションラベルのみ表示（将来の拡張用）
         section_label = ctk.CTkLabel(
             parent,
-            text=f"▼ {self.locale.get('settings_audio')}",
-            font=ctk.CTkFont(size=14, weight="bold")
+            text=f"▼ {_t('settings_audio')}",
+            font=self._section_font
         )
         section_label.pack(anchor="w", pady=(10, 5))
 
         # 説明テキスト
         info_label = ctk.CTkLabel(
             parent,
-            text=self.locale.get("settings_audio_info"),
-            font=ctk.CTkFont(size=12),
+            text=_t("settings_audio_info"),
+            font=self._info_font,
             text_color="gray"
         )
         info_label.pack(anchor="w", padx=10, pady=5)
 
     def _create_transcription_section(self, parent) -> None:
         """文字起こし設定セクション"""
+        _t = self.locale.get  # 属性参照をローカルに束縛
         section_label = ctk.CTkLabel(
             parent,
-            text=f"▼ {self.locale.get('settings_transcription')}",
-            font=ctk.CTkFont(size=14, weight="bold")
+            text=f"▼ {_t('settings_transcription')}",
+            font=self._section_font
         )
         section_label.pack(anchor="w", pady=(20, 5))
 
@@ -100,7 +135,7 @@ class SettingsDialog(ctk.CTkToplevel):
 
         chunk_label = ctk.CTkLabel(
             chunk_frame,
-            text=self.locale.get("settings_chunk_duration"),
+            text=_t("settings_chunk_duration"),
             width=150
         )
         chunk_label.pack(side="left", padx=10)
@@ -126,7 +161,7 @@ class SettingsDialog(ctk.CTkToplevel):
 
         model_label = ctk.CTkLabel(
             model_frame,
-            text=self.locale.get("settings_model"),
+            text=_t("settings_model"),
             width=150
         )
         model_label.pack(side="left", padx=10)
@@ -149,7 +184,7 @@ class SettingsDialog(ctk.CTkToplevel):
 
         lang_label = ctk.CTkLabel(
             lang_frame,
-            text=self.locale.get("settings_language"),
+            text=_t("settings_language"),
             width=150
         )
         lang_label.pack(side="left", padx=10)
@@ -164,10 +199,11 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _create_vad_section(self, parent) -> None:
         """VAD設定セクション"""
+        _t = self.locale.get  # 属性参照をローカルに束縛
         section_label = ctk.CTkLabel(
             parent,
-            text=f"▼ {self.locale.get('settings_vad')}",
-            font=ctk.CTkFont(size=14, weight="bold")
+            text=f"▼ {_t('settings_vad')}",
+            font=self._section_font
         )
         section_label.pack(anchor="w", pady=(20, 5))
 
@@ -177,8 +213,8 @@ class SettingsDialog(ctk.CTkToplevel):
 
         vad_info_label = ctk.CTkLabel(
             vad_frame,
-            text=self.locale.get("settings_vad_info"),
-            font=ctk.CTkFont(size=12),
+            text=_t("settings_vad_info"),
+            font=self._info_font,
             text_color="gray"
         )
         vad_info_label.pack(side="left", padx=10)
@@ -189,7 +225,7 @@ class SettingsDialog(ctk.CTkToplevel):
 
         sensitivity_label = ctk.CTkLabel(
             sensitivity_frame,
-            text=self.locale.get("settings_vad_sensitivity"),
+            text=_t("settings_vad_sensitivity"),
             width=150
         )
         sensitivity_label.pack(side="left", padx=10)
@@ -205,7 +241,7 @@ class SettingsDialog(ctk.CTkToplevel):
 
         self.vad_sensitivity_label = ctk.CTkLabel(
             sensitivity_frame,
-            text=self.locale.get("settings_sensitivity_medium"),
+            text=_t("settings_sensitivity_medium"),
             width=50
         )
         self.vad_sensitivity_label.pack(side="left", padx=5)
@@ -215,10 +251,11 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _create_output_section(self, parent) -> None:
         """出力設定セクション"""
+        _t = self.locale.get  # 属性参照をローカルに束縛
         section_label = ctk.CTkLabel(
             parent,
-            text=f"▼ {self.locale.get('settings_output')}",
-            font=ctk.CTkFont(size=14, weight="bold")
+            text=f"▼ {_t('settings_output')}",
+            font=self._section_font
         )
         section_label.pack(anchor="w", pady=(20, 5))
 
@@ -228,7 +265,7 @@ class SettingsDialog(ctk.CTkToplevel):
 
         format_label = ctk.CTkLabel(
             format_frame,
-            text=self.locale.get("settings_output_format"),
+            text=_t("settings_output_format"),
             width=150
         )
         format_label.pack(side="left", padx=10)
@@ -243,13 +280,14 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _create_button_frame(self) -> None:
         """ボタンフレーム"""
+        _t = self.locale.get  # 属性参照をローカルに束縛
         button_frame = ctk.CTkFrame(self)
         button_frame.pack(fill="x", padx=20, pady=10)
 
         # キャンセルボタン
         cancel_button = ctk.CTkButton(
             button_frame,
-            text=self.locale.get("btn_cancel"),
+            text=_t("btn_cancel"),
             width=100,
             command=self._on_cancel
         )
@@ -258,7 +296,7 @@ class SettingsDialog(ctk.CTkToplevel):
         # 保存ボタン
         save_button = ctk.CTkButton(
             button_frame,
-            text=self.locale.get("btn_save"),
+            text=_t("btn_save"),
             width=100,
             command=self._on_save
         )
@@ -266,47 +304,42 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _load_current_settings(self) -> None:
         """現在の設定値を読み込み"""
+        # 必要な設定値を1回のスナップショットでまとめて取得
+        chunk_duration, model, language, vad_aggressiveness, output_format = (
+            self.settings.get_many(
+                [
+                    "transcription.chunk_duration_sec",
+                    "transcription.model",
+                    "transcription.language",
+                    "vad.aggressiveness",
+                    "output.format",
+                ],
+                [30, "whisper-groq", "ja", 2, "txt"],
+            )
+        )
+
         # チャンク間隔
-        chunk_duration = self.settings.get("transcription.chunk_duration_sec", 30)
         self.chunk_entry.insert(0, str(chunk_duration))
 
         # APIモデル
-        model = self.settings.get("transcription.model", "whisper-groq")
-        model_map = {
-            "whisper-groq": "Whisper (Groq)",
-            "gpt-4o-transcribe": "gpt-4o-transcribe",
-            "gpt-4o-diarize": "gpt-4o-diarize"
-        }
-        self.model_combo.set(model_map.get(model, "Whisper (Groq)"))
+        self.model_combo.set(self._MODEL_FWD.get(model, "Whisper (Groq)"))
 
         # 言語
-        language = self.settings.get("transcription.language", "ja")
-        lang_map = {
-            "ja": "日本語 (ja)",
-            "zh-CN": "中文简体 (zh-CN)",
-            "zh": "中文简体 (zh-CN)",  # 後方互換性
-            "en": "English (en)"
-        }
-        self.lang_combo.set(lang_map.get(language, "日本語 (ja)"))
+        self.lang_combo.set(self._LANG_FWD.get(language, "日本語 (ja)"))
 
         # VAD感度（VADは常に有効）
-        vad_aggressiveness = self.settings.get("vad.aggressiveness", 2)
         self.vad_sensitivity_slider.set(vad_aggressiveness)
         self._update_vad_label(vad_aggressiveness)
 
         # 出力フォーマット
-        output_format = self.settings.get("output.format", "txt")
         self.format_combo.set(output_format)
 
     def _update_vad_label(self, value) -> None:
-        """VAD感度ラベルを更新"""
-        value = int(float(value))
-        label_map = {
-            0: "settings_sensitivity_low",
-            1: "settings_sensitivity_medium",
-            2: "settings_sensitivity_high"
-        }
-        self.vad_sensitivity_label.configure(text=self.locale.get(label_map.get(value, "settings_sensitivity_medium")))
+        """VAD感度ラベルを更新（スライダーのcommandとしてドラッグ中も発火する）"""
+        idx = int(float(value))
+        if idx < 0 or idx > 2:
+            idx = 1  # 範囲外は「中」にフォールバック
+        self.vad_sensitivity_label.configure(text=self.locale.get(self._VAD_LABELS[idx]))
 
     def _on_save(self) -> None:
         """保存ボタンクリック時"""
@@ -330,23 +363,11 @@ class SettingsDialog(ctk.CTkToplevel):
             self.settings.update("transcription.chunk_duration_sec", chunk_duration)
 
             # APIモデル
-            model_text = self.model_combo.get()
-            model_map = {
-                "Whisper (Groq)": "whisper-groq",
-                "gpt-4o-transcribe": "gpt-4o-transcribe",
-                "gpt-4o-diarize": "gpt-4o-diarize"
-            }
-            model = model_map.get(model_text, "whisper-groq")
+            model = self._MODEL_REV.get(self.model_combo.get(), "whisper-groq")
             self.settings.update("transcription.model", model)
 
             # 言語
-            lang_text = self.lang_combo.get()
-            if "ja" in lang_text:
-                language = "ja"
-            elif "zh-CN" in lang_text:
-                language = "zh-CN"
-            else:
-                language = "en"
+            language = self._LANG_REV.get(self.lang_combo.get(), "ja")
             self.settings.update("transcription.language", language)
 
             # VAD（常に有効なので感度のみ保存）
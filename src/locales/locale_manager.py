@@ -3,14 +3,27 @@
 多言語対応のためのリソース管理
 """
 import json
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 from src.utils.logger import logger
 
+# orjson（C実装）があればそちらを使う（stdlib jsonの3〜5倍高速。必須依存ではない）
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 言語リソースディレクトリ（呼び出し毎のPath解決を避ける）
+_LOCALE_DIR = Path(__file__).parent
+
 
 class LocaleManager:
     """言語リソース管理クラス"""
 
+    # 言語コード→パース済み翻訳辞書のキャッシュ（プロセス内で各ファイルを1回だけ読む）
+    _TRANSLATION_CACHE: Dict[str, Dict[str, str]] = {}
+
     def __init__(self, language: str = "ja"):
         """
         ローカライゼーションマネージャの初期化
@@ -20,20 +33,36 @@ class LocaleManager:
         """
         self.language = language
         self.translations: Dict[str, str] = {}
+        # (key)→解決済みテキストのメモ（スライダー操作等で同一キーが高頻度参照される）
+        self._get_cache: Dict[str, str] = {}
         self._load_translations()
 
     def _load_translations(self) -> None:
-        """言語リソースファイルを読み込む"""
-        locale_dir = Path(__file__).parent
-        locale_file = locale_dir / f"{self.language}.json"
+        """言語リソースファイルを読み込む（パース結果はプロセス内でキャッシュ）"""
+        self._get_cache.clear()
+
+        locale_file = _LOCALE_DIR / f"{self.language}.json"
+        effective_language = self.language
 
         if not locale_file.exists():
             logger.warning(f"Locale file not found: {locale_file}, falling back to ja")
-            locale_file = locale_dir / "ja.json"
+            locale_file = _LOCALE_DIR / "ja.json"
+            # フォールバック時は実際に読んだ言語でキャッシュする
+            # （存在しない言語コードのたびにja.jsonを再パースしない）
+            effective_language = "ja"
+
+        cached = self._TRANSLATION_CACHE.get(effective_language)
+        if cached is not None:
+            self.translations = cached
+            return
 
         try:
-            with open(locale_file, "r", encoding="utf-8") as f:
-                self.translations = json.load(f)
+            if _orjson is not None:
+                self.translations = _orjson.loads(locale_file.read_bytes())
+            else:
+                with open(locale_file, "r", encoding="utf-8") as f:
+                    self.translations = json.load(f)
+            self._TRANSLATION_CACHE[effective_language] = self.translations
             logger.info(f"Loaded translations for language: {self.language}")
         except Exception as e:
             logger.error(f"Failed to load translations: {e}")
@@ -50,7 +79,17 @@ class LocaleManager:
         Returns:
             翻訳されたテキスト
         """
-        return self.translations.get(key, default or key)
+        val = self._get_cache.get(key)
+        if val is not None:
+            return val
+
+        val = self.translations.get(key)
+        if val is None:
+            # 未登録キーはキャッシュしない（呼び出し側ごとにdefaultが異なりうるため）
+            return default or key
+
+        self._get_cache[key] = val
+        return val
 
     def set_language(self, language: str) -> None:
         """
@@ -87,6 +126,7 @@ class LocaleManager:
 
 # グローバルインスタンス（シングルトンパターン）
 _locale_manager: Optional[LocaleManager] = None
+_locale_lock = threading.Lock()
 
 
 def get_locale_manager(language: Optional[str] = None) -> LocaleManager:
@@ -101,7 +141,12 @@ def get_locale_manager(language: Optional[str] = None) -> LocaleManager:
     """
     global _locale_manager
     if _locale_manager is None:
-        _locale_manager = LocaleManager(language or "ja")
+        # ダブルチェックロック: GUIスレッドとワーカースレッドが同時に
+        # 初期化してインスタンスを二重生成するのを防ぐ
+        # （通常パスはロックを取らない）
+        with _locale_lock:
+            if _locale_manager is None:
+                _locale_manager = LocaleManager(language or "ja")
     elif language and language != _locale_manager.language:
         _locale_manager.set_language(language)
     return _locale_manager
@@ -9,7 +9,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.utils.logger import setup_logger
+from src.utils.logger import setup_logger, shutdown_logger
 from src.config.settings import init_settings, get_settings
 from src.gui.main_window import MainWindow
 
@@ -31,7 +31,11 @@ def main():
     # メインウィンドウの作成と起動
     app = MainWindow(settings)
     app.protocol("WM_DELETE_WINDOW", app.on_closing)
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        # 非同期ログシンクの未書き込み分をフラッシュ
+        shutdown_logger()
 
 
 if __name__ == "__main__":
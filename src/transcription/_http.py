@@ -0,0 +1,139 @@
+"""
+文字起こしクライアント共有のHTTP接続プール
+GPT4o/Whisper両クライアントで同じkeep-alive接続を使い回す
+"""
+import asyncio
+import atexit
+import threading
+import time
+from typing import Optional
+import httpx
+
+# 接続プール設定（keep-aliveを30秒維持し、チャンク毎のTLS再確立を避ける）
+# HTTP/2はh2パッケージが必須依存ではないため有効化しない
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+_TIMEOUT = 60.0
+
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+class RateLimiter:
+    """
+    AIMD方式（加法増加・乗法減少）の同時実行数制御
+
+    共有httpxクライアントのレスポンスフックとして全APIレスポンスを観測し、
+    - 429受信時: 同時実行数を半減し、Retry-Afterの指示する時間まで送信を保留
+    - 成功時: 同時実行数を0.5ずつ回復（上限まで）
+    する。429をリトライで吸収するのではなく、そもそも出さないための制御。
+    """
+
+    def __init__(self, min_concurrency: int = 1, max_concurrency: int = 8):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.remaining_requests: Optional[int] = None
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+
+    def on_response(self, response: httpx.Response) -> None:
+        """httpxレスポンスフック（同期クライアント用）"""
+        try:
+            status = response.status_code
+
+            remaining = response.headers.get("x-ratelimit-remaining-requests")
+            if remaining is not None:
+                try:
+                    self.remaining_requests = int(remaining)
+                except ValueError:
+                    pass
+
+            with self._lock:
+                if status == 429:
+                    # 乗法減少
+                    self.concurrency = max(
+                        float(self.min_concurrency), self.concurrency * 0.5
+                    )
+                    # Retry-Afterを尊重して送信を保留
+                    retry_after = response.headers.get("retry-after")
+                    try:
+                        delay = float(retry_after) if retry_after else 1.0
+                    except ValueError:
+                        delay = 1.0
+                    self._pause_until = max(
+                        self._pause_until, time.monotonic() + delay
+                    )
+                elif status < 400:
+                    # 加法増加
+                    self.concurrency = min(
+                        float(self.max_concurrency), self.concurrency + 0.5
+                    )
+        except Exception:
+            # フック内の例外でリクエスト自体を壊さない
+            pass
+
+    async def on_response_async(self, response: httpx.Response) -> None:
+        """httpxレスポンスフック（非同期クライアント用）"""
+        self.on_response(response)
+
+    @property
+    def limit(self) -> int:
+        """現在の推奨同時実行数"""
+        return max(self.min_concurrency, int(self.concurrency))
+
+    def wait_time(self) -> float:
+        """Retry-Afterによる送信保留の残り秒数（保留がなければ0）"""
+        return max(0.0, self._pause_until - time.monotonic())
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """共有のレートリミッタを取得"""
+    return _rate_limiter
+
+
+def get_http_client() -> httpx.Client:
+    """共有の同期httpxクライアントを取得（初回呼び出しで生成）"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=_TIMEOUT,
+            limits=_LIMITS,
+            event_hooks={"response": [_rate_limiter.on_response]},
+        )
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """共有の非同期httpxクライアントを取得（初回呼び出しで生成）"""
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(
+            timeout=_TIMEOUT,
+            limits=_LIMITS,
+            event_hooks={"response": [_rate_limiter.on_response_async]},
+        )
+    return _async_http_client
+
+
+def _close_clients() -> None:
+    """プロセス終了時に接続を閉じる（Event loop closedエラー対策）"""
+    if _http_client is not None:
+        try:
+            _http_client.close()
+        except Exception:
+            pass
+    if _async_http_client is not None:
+        try:
+            asyncio.run(_async_http_client.aclose())
+        except Exception:
+            pass
+
+
+atexit.register(_close_clients)
@@ -0,0 +1,75 @@
+"""
+文字起こしクライアント共有のアップロード用ヘルパー
+WAVヘッダとPCMデータを連結コピーせずにストリーミング読み出しする
+"""
+import io
+
+
+class StreamingWavFile(io.RawIOBase):
+    """
+    WAVヘッダ + PCMデータを1つのファイルとして読み出せるストリーム
+
+    `bytes(header) + pcm_data` の連結はチャンク毎に約2MBの複製を
+    作るため、ヘッダとPCMのmemoryviewを保持し、read()要求の範囲だけを
+    切り出して返す。同時実行数分のチャンクが在飛行中でも常駐コピーは
+    発生しない。
+    """
+
+    def __init__(self, header: bytes, pcm_data: bytes):
+        """
+        Args:
+            header: WAVヘッダ（44バイトのRIFFヘッダ）
+            pcm_data: 生のPCMデータ（bytes）
+        """
+        self._header = header
+        self._pcm = memoryview(pcm_data)
+        self._size = len(header) + len(pcm_data)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._pos = max(0, min(pos, self._size))
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._size - self._pos
+        if size <= 0 or self._pos >= self._size:
+            return b""
+
+        end = min(self._pos + size, self._size)
+        header_len = len(self._header)
+        parts = []
+
+        # ヘッダ部分
+        if self._pos < header_len:
+            parts.append(self._header[self._pos:min(end, header_len)])
+
+        # PCM部分（要求範囲のみをmemoryviewから切り出す）
+        if end > header_len:
+            start = max(self._pos, header_len) - header_len
+            parts.append(bytes(self._pcm[start:end - header_len]))
+
+        self._pos = end
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def close(self) -> None:
+        # memoryviewを解放して下のPCMバッファへの参照を切る
+        self._pcm.release()
+        super().close()
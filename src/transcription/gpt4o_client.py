@@ -2,13 +2,21 @@
 OpenAI GPT-4o Audio API クライアント
 gpt-4o-transcribe および gpt-4o-transcribe-diarize 対応
 """
-import io
+import asyncio
+import struct
 import time
-import wave
 from typing import Optional, List, Dict
 import httpx
+import numpy as np
 from openai import OpenAI, AsyncOpenAI
 from src.utils.logger import logger
+from src.transcription import result_cache
+from src.transcription._upload import StreamingWavFile
+from src.transcription._http import (
+    get_http_client,
+    get_async_http_client,
+    get_rate_limiter,
+)
 
 
 class GPT4oTranscriber:
@@ -18,6 +26,38 @@ class GPT4oTranscriber:
     - gpt-4o-transcribe-diarize: 話者分離付き文字起こし
     """
 
+    # 話者ラベルテーブル（新規話者ごとのf-string生成を回避）
+    # 27人目以降は番号ラベルまで事前生成しておき、ループ内の
+    # 範囲チェック分岐そのものを不要にする
+    _SPEAKER_LABELS = (
+        tuple(f"話者{c}" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        + tuple(f"話者{i}" for i in range(27, 200))
+    )
+
+    # APIキー毎のSDKクライアントキャッシュ（クラス全体で共有）。
+    # 録音セッション毎にトランスクライバを作り直しても、SDKクライアントと
+    # その下の共有接続プールを使い回す
+    _client_cache: Dict[str, OpenAI] = {}
+    _async_client_cache: Dict[str, AsyncOpenAI] = {}
+
+    @classmethod
+    def _get_client(cls, api_key: str) -> OpenAI:
+        """APIキーに対応する共有OpenAIクライアントを取得（初回のみ生成）"""
+        client = cls._client_cache.get(api_key)
+        if client is None:
+            client = OpenAI(api_key=api_key, http_client=get_http_client())
+            cls._client_cache[api_key] = client
+        return client
+
+    @classmethod
+    def _get_async_client(cls, api_key: str) -> AsyncOpenAI:
+        """APIキーに対応する共有AsyncOpenAIクライアントを取得（初回のみ生成）"""
+        client = cls._async_client_cache.get(api_key)
+        if client is None:
+            client = AsyncOpenAI(api_key=api_key, http_client=get_async_http_client())
+            cls._async_client_cache[api_key] = client
+        return client
+
     def __init__(
         self,
         api_key: str,
@@ -28,7 +68,8 @@ class GPT4oTranscriber:
         sample_rate: int = 16000,
         channels: int = 1,
         prompt_template: str = "",
-        use_context: bool = False
+        use_context: bool = False,
+        on_partial: Optional[callable] = None
     ):
         """
         GPT-4o クライアントの初期化
@@ -43,6 +84,7 @@ class GPT4oTranscriber:
             channels: チャンネル数
             prompt_template: プロンプトテンプレート
             use_context: 前チャンクをコンテキストとして使用
+            on_partial: ストリーミング中の部分テキスト受信コールバック
         """
         self.api_key = api_key
         self.model_name = model_name
@@ -54,12 +96,35 @@ class GPT4oTranscriber:
         self.channels = channels
         self.prompt_template = prompt_template
         self.use_context = use_context
+        self.on_partial = on_partial
         self.previous_text = ""
         self.previous_speakers = []  # 最後の3話者を追跡
 
-        # OpenAIクライアント
-        self.client = OpenAI(api_key=api_key)
-        self.async_client = AsyncOpenAI(api_key=api_key)
+        # WAVヘッダテンプレート（44バイトのRIFFヘッダ。フォーマットは
+        # インスタンスで固定なので一度だけ構築し、チャンク毎はサイズの
+        # 2箇所をpack_intoで書き換えるだけにする）
+        self._wav_header_template = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 0, b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate,
+            sample_rate * channels * 2, channels * 2, 16,
+            b'data', 0
+        )
+
+        # リトライ時の待機秒数テーブル（指数バックオフ: 1, 2, 4, ...）
+        self._backoff = tuple(2 ** i for i in range(max_retries))
+
+        # API呼び出しパラメータの固定部分（モデル・応答フォーマットは
+        # インスタンスで不変なので、リクエスト毎に組み立て直さない）
+        self._base_params = {
+            "model": model_name,
+            "response_format": "diarized_json" if enable_diarization else "text",
+        }
+
+        # OpenAIクライアント（クラス共有キャッシュから取得。
+        # 接続プールはWhisperクライアントとも共有）
+        self.client = self._get_client(api_key)
+        self.async_client = self._get_async_client(api_key)
 
         # 統計情報
         self.total_requests = 0
@@ -85,28 +150,58 @@ class GPT4oTranscriber:
             return "zh"
         return language
 
-    def _convert_to_wav(self, pcm_data: bytes) -> bytes:
+    def _convert_to_wav(self, pcm_data: bytes) -> tuple:
         """
-        生のPCMデータをWAVフォーマットに変換
+        生のPCMデータをWAVフォーマットのアップロード用タプルに変換
 
         Args:
             pcm_data: 生のPCMデータ（bytes）
 
         Returns:
-            WAVフォーマットの音声データ
+            (ファイル名, ストリーム, MIMEタイプ) のタプル。
+            SDK/httpxがマルチパート本文として直接読み出せる形式
         """
-        wav_buffer = io.BytesIO()
-        try:
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(self.channels)
-                wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-                wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(pcm_data)
+        # 事前構築したヘッダテンプレートにデータ長を書き込む
+        # （waveモジュール経由のヘッダ生成・ディスパッチを省く）
+        header = bytearray(self._wav_header_template)
+        n = len(pcm_data)
+        struct.pack_into('<I', header, 4, 36 + n)   # RIFFチャンクサイズ
+        struct.pack_into('<I', header, 40, n)       # dataチャンクサイズ
+
+        # ヘッダ+PCMの連結コピー（チャンクあたり約2MB）を作らず、
+        # memoryview越しに逐次読み出すストリームとして渡す
+        return ("audio.wav", StreamingWavFile(bytes(header), pcm_data), "audio/wav")
+
+    def _consume_stream(self, response) -> str:
+        """
+        ストリーミングレスポンスからテキストを組み立て
 
-            # getvalue()はread()よりもメモリ効率的
-            return wav_buffer.getvalue()
-        finally:
-            wav_buffer.close()
+        transcript.text.deltaイベント毎にon_partialコールバックを呼び、
+        transcript.text.doneの確定テキスト（なければデルタの結合）を返す。
+
+        Args:
+            response: ストリーミングイベントのイテレータ
+
+        Returns:
+            文字起こしテキスト
+        """
+        parts = []
+        final_text = None
+        for event in response:
+            event_type = getattr(event, "type", "")
+            if event_type == "transcript.text.delta":
+                delta = event.delta
+                parts.append(delta)
+                if self.on_partial:
+                    try:
+                        self.on_partial(delta)
+                    except Exception as e:
+                        logger.debug(f"on_partial callback error: {e}")
+            elif event_type == "transcript.text.done":
+                final_text = event.text
+
+        text = final_text if final_text is not None else "".join(parts)
+        return text.strip()
 
     def transcribe(
         self,
@@ -123,57 +218,139 @@ class GPT4oTranscriber:
         Returns:
             文字起こし結果のテキスト
         """
+        # プロンプト構築（リトライ間で変わらないためループ外で行う）
+        prompt = self.prompt_template if self.prompt_template else ""
+        if self.use_context and self.previous_text:
+            context = self.previous_text  # 保存時点で50文字に丸め済み
+            prompt = f"{prompt}\n前の発話: {context}" if prompt else f"前の発話: {context}"
+
+        # 同一音声・同一条件の結果はキャッシュから返す（再アップロード・再課金を回避）
+        cache_key = result_cache.make_key(
+            audio_chunk, self.model_name, self.language, prompt
+        )
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Transcription cache hit at {timestamp:.2f}s")
+            self.previous_text = cached[-50:]
+            return cached
+
         for attempt in range(self.max_retries):
             try:
-                # PCMデータをWAVフォーマットに変換
-                wav_data = self._convert_to_wav(audio_chunk)
+                # PCMデータをWAVフォーマットに変換（アップロード用タプルをそのまま取得）
+                audio_file = self._convert_to_wav(audio_chunk)
+
+                # API呼び出しパラメータ（固定部分は事前構築済み）
+                params = {**self._base_params, "file": audio_file}
 
-                # 音声データをファイルライクオブジェクトに変換
-                audio_file = io.BytesIO(wav_data)
-                audio_file.name = "audio.wav"
+                # プロンプトを追加
+                if prompt:
+                    params["prompt"] = prompt
+
+                # GPT-4o Audio API呼び出し
+                if self.enable_diarization:
+                    # diarized_jsonはストリーミング非対応
+                    response = self.client.audio.transcriptions.create(**params)
+                    self.total_requests += 1
+                    logger.opt(lazy=True).debug(
+                        "Diarize response type: {}", lambda: type(response)
+                    )
+                    text = self._format_diarized_response(response, timestamp)
+                else:
+                    # ストリーミングモードで呼び出し、デルタを逐次受信する
+                    # （全文のデコード完了を待たずに最初のトークンから処理できる）
+                    response = self.client.audio.transcriptions.create(
+                        stream=True, **params
+                    )
+                    self.total_requests += 1
+                    text = self._consume_stream(response)
+
+                if text:
+                    # 前チャンクとして保存し、結果をキャッシュ
+                    self.previous_text = text[-50:]
+                    result_cache.put(cache_key, text)
+                    logger.info(
+                        f"Transcription success: {len(text)} chars at {timestamp:.2f}s"
+                    )
+                    return text
+                else:
+                    logger.warning(f"Empty transcription at {timestamp:.2f}s")
+                    return None
+
+            except httpx.HTTPStatusError as e:
+                self.total_errors += 1
+                if e.response.status_code == 429:  # Rate limit
+                    wait_time = self._backoff[attempt]  # 指数バックオフ
+                    logger.warning(
+                        f"Rate limit exceeded, retrying in {wait_time}s "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    time.sleep(wait_time)
+                else:
+                    logger.error(f"HTTP error {e.response.status_code}: {e}")
+                    if attempt == self.max_retries - 1:
+                        return None
+
+            except Exception as e:
+                self.total_errors += 1
+                logger.error(
+                    f"Transcription error (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt == self.max_retries - 1:
+                    return None
+                time.sleep(self._backoff[attempt])
+
+        return None
+
+    async def transcribe_async(
+        self,
+        audio_chunk: bytes,
+        timestamp: float = 0.0
+    ) -> Optional[str]:
+        """
+        音声チャンクを文字起こし（非同期）
+
+        同期版と同じリトライ・バックオフ処理をAsyncOpenAI経由で行う。
+        asyncio.gatherで連続チャンクをパイプライン化したい呼び出し側向け。
+
+        Args:
+            audio_chunk: 音声データ（bytes）
+            timestamp: タイムスタンプ（秒）
+
+        Returns:
+            文字起こし結果のテキスト
+        """
+        for attempt in range(self.max_retries):
+            try:
+                # PCMデータをWAVフォーマットに変換（アップロード用タプルをそのまま取得）
+                audio_file = self._convert_to_wav(audio_chunk)
 
                 # プロンプト構築
                 prompt = self.prompt_template if self.prompt_template else ""
                 if self.use_context and self.previous_text:
-                    context = self.previous_text[-50:]  # 最後の50文字
+                    context = self.previous_text  # 保存時点で50文字に丸め済み
                     prompt = f"{prompt}\n前の発話: {context}" if prompt else f"前の発話: {context}"
 
-                # API呼び出しパラメータ
-                params = {
-                    "model": self.model_name,
-                    "file": audio_file,
-                }
+                # API呼び出しパラメータ（固定部分は事前構築済み）
+                params = {**self._base_params, "file": audio_file}
 
-                # プロンプトを追加
                 if prompt:
                     params["prompt"] = prompt
 
-                # 話者分離が有効な場合はdiarized_jsonを使用
-                if self.enable_diarization:
-                    params["response_format"] = "diarized_json"
-                else:
-                    params["response_format"] = "text"
-
-                # GPT-4o Audio API呼び出し
-                response = self.client.audio.transcriptions.create(**params)
+                # GPT-4o Audio API呼び出し（非同期）
+                response = await self.async_client.audio.transcriptions.create(**params)
 
                 self.total_requests += 1
 
                 # レスポンスの処理
                 if self.enable_diarization:
-                    # diarized_jsonレスポンスを処理
-                    logger.debug(f"Diarize response type: {type(response)}")
                     text = self._format_diarized_response(response, timestamp)
                 else:
-                    # 通常のテキストレスポンス
-                    if isinstance(response, str):
-                        text = response.strip()
-                    else:
-                        text = response.text.strip() if hasattr(response, "text") else ""
+                    # str/オブジェクトの両対応を1回の属性参照で処理
+                    text = getattr(response, "text", response)
+                    text = text.strip() if isinstance(text, str) else ""
 
                 if text:
-                    # 前チャンクとして保存
-                    self.previous_text = text
+                    self.previous_text = text[-50:]
                     logger.info(
                         f"Transcription success: {len(text)} chars at {timestamp:.2f}s"
                     )
@@ -185,12 +362,12 @@ class GPT4oTranscriber:
             except httpx.HTTPStatusError as e:
                 self.total_errors += 1
                 if e.response.status_code == 429:  # Rate limit
-                    wait_time = 2 ** attempt  # 指数バックオフ
+                    wait_time = self._backoff[attempt]  # 指数バックオフ
                     logger.warning(
                         f"Rate limit exceeded, retrying in {wait_time}s "
                         f"(attempt {attempt + 1}/{self.max_retries})"
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     logger.error(f"HTTP error {e.response.status_code}: {e}")
                     if attempt == self.max_retries - 1:
@@ -203,10 +380,50 @@ class GPT4oTranscriber:
                 )
                 if attempt == self.max_retries - 1:
                     return None
-                time.sleep(1)
+                await asyncio.sleep(self._backoff[attempt])
 
         return None
 
+    async def transcribe_many_async(
+        self,
+        chunks: List[bytes],
+        timestamps: List[float],
+        max_concurrent: Optional[int] = None
+    ) -> list:
+        """
+        複数チャンクを並行して非同期文字起こし
+
+        セマフォで同時リクエスト数を制限しつつasyncio.gatherで
+        ファンアウトする。上限を指定しない場合は共有レートリミッタの
+        AIMD制御値（429で半減・成功で回復）に従う。結果は入力と同じ
+        順序で返るため、呼び出し側の順序保証はそのまま維持される。
+
+        Args:
+            chunks: 音声データ（bytes）のリスト
+            timestamps: 各チャンクのタイムスタンプ（秒）
+            max_concurrent: 同時実行するリクエストの上限（Noneで自動制御）
+
+        Returns:
+            chunksと同じ順序の結果リスト（失敗した要素は例外オブジェクト）
+        """
+        limiter = get_rate_limiter()
+        if max_concurrent is None:
+            max_concurrent = limiter.limit
+        sem = asyncio.Semaphore(max_concurrent)
+
+        async def one(chunk: bytes, ts: float):
+            async with sem:
+                # Retry-Afterによる送信保留を尊重してから投げる
+                delay = limiter.wait_time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                return await self.transcribe_async(chunk, ts)
+
+        return await asyncio.gather(
+            *(one(c, t) for c, t in zip(chunks, timestamps)),
+            return_exceptions=True
+        )
+
     def _format_diarized_response(
         self,
         response: any,
@@ -223,82 +440,61 @@ class GPT4oTranscriber:
             フォーマット済みテキスト（話者A: テキスト形式）
         """
         try:
-            # レスポンスがオブジェクトの場合、辞書に変換
-            if hasattr(response, 'model_dump'):
-                response_dict = response.model_dump()
-            elif hasattr(response, 'to_dict'):
-                response_dict = response.to_dict()
-            elif isinstance(response, dict):
-                response_dict = response
+            # セグメントを直接参照する（model_dump()による全体の辞書化は
+            # 大きなレスポンスでは再帰的なdict構築コストがかかるため行わない。
+            # 個々のセグメントの辞書/オブジェクト両対応は下流で処理済み）
+            if isinstance(response, dict):
+                segments = response.get("segments", [])
             else:
-                # レスポンスがオブジェクトの場合、属性でアクセス
-                response_dict = {}
-                if hasattr(response, 'segments'):
-                    response_dict['segments'] = response.segments
-                if hasattr(response, 'text'):
-                    response_dict['text'] = response.text
-
-            logger.debug(f"Response keys: {list(response_dict.keys())}")
-
-            # セグメント情報を取得
-            segments = response_dict.get("segments", [])
+                segments = getattr(response, "segments", None) or []
 
-            # セグメントをマージ
+            # 入口で一度だけ辞書形式に正規化し、以降は辞書のみを扱う
             if segments:
+                segments = self._normalize_segments(segments)
                 segments = self._merge_speaker_segments(segments)
 
             if not segments:
                 # セグメントがない場合、全体のテキストを返す
-                text = response_dict.get("text", "")
-                if text:
-                    return text.strip()
-                # 属性でアクセスを試みる
-                if hasattr(response, 'text'):
-                    return response.text.strip()
-                return ""
+                if isinstance(response, dict):
+                    text = response.get("text", "")
+                else:
+                    text = getattr(response, "text", "")
+                return text.strip() if text else ""
 
             # 話者ラベルのマッピング
+            # （数百セグメントの長い会議でも1パスで整形と話者収集を行う。
+            #   以前はラベル整形と話者履歴収集でセグメントを2周し、
+            #   1セグメントあたりのget呼び出しが倍になっていた）
             speaker_map = {}
-            speaker_labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            speaker_labels = self._SPEAKER_LABELS
 
             formatted_parts = []
+            speakers = []
             for segment in segments:
-                # セグメントが辞書でない場合、オブジェクトとして扱う
-                if isinstance(segment, dict):
-                    speaker_id = segment.get("speaker", "UNKNOWN")
-                    text = segment.get("text", "").strip()
-                else:
-                    speaker_id = getattr(segment, "speaker", "UNKNOWN")
-                    text = getattr(segment, "text", "").strip()
+                # 正規化済みのためセグメントは辞書のみ
+                speaker_id = segment.get("speaker")
+                text = segment.get("text", "")
 
+                # 話者情報を収集（話者IDがあるセグメントのみ）
+                if speaker_id:
+                    speakers.append(speaker_id)
+
+                text = text.strip() if text else ""
                 if not text:
                     continue
 
                 # 話者ラベルの取得または生成
-                if speaker_id not in speaker_map:
-                    speaker_index = len(speaker_map)
-                    if speaker_index < len(speaker_labels):
-                        speaker_map[speaker_id] = f"話者{speaker_labels[speaker_index]}"
-                    else:
-                        speaker_map[speaker_id] = f"話者{speaker_index + 1}"
-
-                speaker_label = speaker_map[speaker_id]
+                # （ラベルは全て事前生成済みのため範囲チェック分岐なし）
+                label_key = speaker_id or "UNKNOWN"
+                speaker_label = speaker_map.setdefault(
+                    label_key, speaker_labels[len(speaker_map)]
+                )
 
                 # フォーマット: 話者A: テキスト
                 formatted_parts.append(f"{speaker_label}: {text}")
 
-            # 話者情報を保存（最後の3話者）
-            if segments:
-                speakers = []
-                for segment in segments:
-                    if isinstance(segment, dict):
-                        speaker_id = segment.get("speaker")
-                    else:
-                        speaker_id = getattr(segment, "speaker", None)
-                    if speaker_id:
-                        speakers.append(speaker_id)
-
-                # 最後の3話者を保存
+            # 最後の3話者を保存
+            if speakers:
                 self.previous_speakers.extend(speakers[-3:])
                 if len(self.previous_speakers) > 3:
                     self.previous_speakers = self.previous_speakers[-3:]
@@ -311,8 +507,8 @@ class GPT4oTranscriber:
 
         except Exception as e:
             logger.error(f"Error formatting diarized response: {e}")
-            logger.debug(f"Response type: {type(response)}")
-            logger.debug(f"Response: {response}")
+            logger.opt(lazy=True).debug("Response type: {}", lambda: type(response))
+            logger.opt(lazy=True).debug("Response: {}", lambda: response)
             # エラー時は通常のテキストとして処理を試みる
             try:
                 if hasattr(response, 'text'):
@@ -323,60 +519,72 @@ class GPT4oTranscriber:
                 pass
             return ""
 
-    def _merge_speaker_segments(self, segments: list) -> list:
+    @staticmethod
+    def _normalize_segments(segments: list) -> list:
         """
-        隣接する同一話者のセグメントをマージ
+        セグメントを辞書形式に正規化
+
+        辞書/Pydanticオブジェクト混在の入力を入口で一度だけ辞書に
+        揃え、下流（マージ・整形）のセグメント毎のisinstance分岐を
+        不要にする。辞書はコピーするため下流で安全に変更できる。
 
         Args:
             segments: セグメントリスト
 
+        Returns:
+            辞書のみのセグメントリスト
+        """
+        return [
+            seg.copy() if isinstance(seg, dict) else {
+                "speaker": getattr(seg, "speaker", None),
+                "start": getattr(seg, "start", 0),
+                "end": getattr(seg, "end", 0),
+                "text": getattr(seg, "text", "")
+            }
+            for seg in segments
+        ]
+
+    def _merge_speaker_segments(self, segments: list) -> list:
+        """
+        隣接する同一話者のセグメントをマージ（NumPyベクトル化）
+
+        話者の切り替わり・2秒以上の間隔をマスク演算で一括検出し、
+        累積和でグループIDを振ってグループ毎に結合する。
+        数百セグメントの長い会議でもPythonループはグループ数分で済む。
+
+        Args:
+            segments: セグメントリスト（_normalize_segments済みの辞書のみ）
+
         Returns:
             マージ済みセグメントリスト
         """
-        if not segments:
+        if len(segments) <= 1:
             return segments
 
-        merged = []
-        current_segment = None
-
-        # 最初のセグメントを辞書形式に変換
-        first_seg = segments[0]
-        if isinstance(first_seg, dict):
-            current_segment = first_seg.copy()
-        else:
-            current_segment = {
-                "speaker": getattr(first_seg, "speaker", "UNKNOWN"),
-                "start": getattr(first_seg, "start", 0),
-                "end": getattr(first_seg, "end", 0),
-                "text": getattr(first_seg, "text", "")
-            }
+        normalized = segments
 
-        for next_seg in segments[1:]:
-            # 次のセグメントを辞書形式に変換
-            if isinstance(next_seg, dict):
-                next_segment = next_seg
-            else:
-                next_segment = {
-                    "speaker": getattr(next_seg, "speaker", "UNKNOWN"),
-                    "start": getattr(next_seg, "start", 0),
-                    "end": getattr(next_seg, "end", 0),
-                    "text": getattr(next_seg, "text", "")
-                }
-
-            # 同じ話者で2秒以内の間隔?
-            time_gap = next_segment.get("start", 0) - current_segment.get("end", 0)
-
-            if (next_segment.get("speaker") == current_segment.get("speaker") and
-                time_gap < 2.0):
-                # マージ
-                current_segment["end"] = next_segment.get("end", current_segment["end"])
-                current_segment["text"] += " " + next_segment.get("text", "")
-            else:
-                # 現在のセグメントを保存し、新しいセグメントを開始
-                merged.append(current_segment)
-                current_segment = next_segment.copy()
+        speakers = np.array(
+            [str(seg.get("speaker")) for seg in normalized], dtype=object
+        )
+        starts = np.array([seg.get("start", 0) for seg in normalized], dtype=np.float64)
+        ends = np.array([seg.get("end", 0) for seg in normalized], dtype=np.float64)
+
+        # 境界マスク: 話者が変わる、または前セグメント終端から2秒以上空く
+        breaks = (speakers[1:] != speakers[:-1]) | (starts[1:] - ends[:-1] >= 2.0)
 
-        merged.append(current_segment)
+        # グループ先頭のインデックス（先頭セグメントは常にグループ開始）
+        group_starts = np.flatnonzero(np.concatenate(([True], breaks)))
+        group_ends = np.concatenate((group_starts[1:], [len(normalized)]))
+
+        merged = []
+        for gs, ge in zip(group_starts, group_ends):
+            segment = normalized[gs]
+            if ge - gs > 1:
+                segment["end"] = normalized[ge - 1].get("end", segment["end"])
+                segment["text"] = " ".join(
+                    normalized[i].get("text", "") for i in range(gs, ge)
+                )
+            merged.append(segment)
         return merged
 
     def _format_timestamp(self, seconds: float) -> str:
@@ -389,9 +597,8 @@ class GPT4oTranscriber:
         Returns:
             タイムスタンプ文字列（HH:MM:SS形式）
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
     def get_stats(self) -> dict:
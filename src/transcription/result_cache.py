@@ -0,0 +1,75 @@
+"""
+文字起こし結果のコンテンツアドレスキャッシュ
+同一音声チャンクの再アップロード・再課金を防ぐ
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+from src.utils.logger import logger
+
+# キャッシュ保存先（output/logsと同様にアプリ作業ディレクトリ配下）
+_CACHE_DIR = Path("cache/transcripts")
+
+
+def make_key(audio_chunk: bytes, model: str, language: str, prompt: str) -> str:
+    """
+    音声チャンクと文字起こし条件からキャッシュキーを生成
+
+    モデル・言語・プロンプトをキーに含めることで、条件が変われば
+    自動的に別エントリになる（明示的な無効化は不要）。
+
+    Args:
+        audio_chunk: 音声データ（bytes）
+        model: モデル名
+        language: 言語コード
+        prompt: 文字起こしプロンプト
+
+    Returns:
+        キャッシュキー（16進ダイジェスト）
+    """
+    h = hashlib.sha256()
+    h.update(audio_chunk)
+    h.update(model.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(language.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(prompt.encode("utf-8"))
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """
+    キャッシュから文字起こし結果を取得
+
+    Args:
+        key: make_keyで生成したキー
+
+    Returns:
+        キャッシュされたテキスト（ミス時はNone）
+    """
+    path = _CACHE_DIR / key[:2] / f"{key}.txt"
+    try:
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+    except Exception as e:
+        logger.debug(f"Transcription cache read failed: {e}")
+    return None
+
+
+def put(key: str, text: str) -> None:
+    """
+    文字起こし結果をキャッシュに保存（アトミック書き込み）
+
+    Args:
+        key: make_keyで生成したキー
+        text: 文字起こし結果
+    """
+    path = _CACHE_DIR / key[:2] / f"{key}.txt"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.debug(f"Transcription cache write failed: {e}")
@@ -2,13 +2,30 @@
 Groq Whisper API クライアント
 Whisper Large V3 Turbo を使用した文字起こし
 """
+import asyncio
+import bisect
 import io
+import struct
 import time
-import wave
-from typing import Optional
+from typing import Dict, List, Optional
 import httpx
+import numpy as np
 from groq import Groq, AsyncGroq
 from src.utils.logger import logger
+from src.transcription import result_cache
+from src.transcription._upload import StreamingWavFile
+from src.transcription._http import (
+    get_http_client,
+    get_async_http_client,
+    get_rate_limiter,
+)
+
+# soundfileがあればFLACアップロードに使う（音声ではWAV比5〜6割程度に
+# 可逆圧縮でき、アップロード時間をほぼ半減できる。必須依存ではない）
+try:
+    import soundfile as _soundfile
+except ImportError:
+    _soundfile = None
 
 
 class WhisperTranscriber:
@@ -19,6 +36,30 @@ class WhisperTranscriber:
     - エラーリトライ
     """
 
+    # APIキー毎のSDKクライアントキャッシュ（クラス全体で共有）。
+    # 録音セッション毎にトランスクライバを作り直しても、SDKクライアントと
+    # その下の共有接続プールを使い回す
+    _client_cache: Dict[str, Groq] = {}
+    _async_client_cache: Dict[str, AsyncGroq] = {}
+
+    @classmethod
+    def _get_client(cls, api_key: str) -> Groq:
+        """APIキーに対応する共有Groqクライアントを取得（初回のみ生成）"""
+        client = cls._client_cache.get(api_key)
+        if client is None:
+            client = Groq(api_key=api_key, http_client=get_http_client())
+            cls._client_cache[api_key] = client
+        return client
+
+    @classmethod
+    def _get_async_client(cls, api_key: str) -> AsyncGroq:
+        """APIキーに対応する共有AsyncGroqクライアントを取得（初回のみ生成）"""
+        client = cls._async_client_cache.get(api_key)
+        if client is None:
+            client = AsyncGroq(api_key=api_key, http_client=get_async_http_client())
+            cls._async_client_cache[api_key] = client
+        return client
+
     def __init__(
         self,
         api_key: str,
@@ -29,7 +70,9 @@ class WhisperTranscriber:
         sample_rate: int = 16000,
         channels: int = 1,
         prompt_template: str = "",
-        use_context: bool = False
+        use_context: bool = False,
+        max_batch_size: int = 4,
+        upload_format: str = "flac"
     ):
         """
         Whisperクライアントの初期化
@@ -44,6 +87,8 @@ class WhisperTranscriber:
             channels: チャンネル数
             prompt_template: プロンプトテンプレート
             use_context: 前チャンクをコンテキストとして使用
+            max_batch_size: transcribe_batchで1リクエストにまとめる最大チャンク数
+            upload_format: アップロード形式（"flac" | "wav"。soundfile未導入時はwav）
         """
         self.api_key = api_key
         self.model_name = model_name
@@ -55,11 +100,28 @@ class WhisperTranscriber:
         self.channels = channels
         self.prompt_template = prompt_template
         self.use_context = use_context
+        self.max_batch_size = max_batch_size
+        if upload_format == "flac" and _soundfile is None:
+            logger.debug("soundfile not available, falling back to WAV upload")
+            upload_format = "wav"
+        self.upload_format = upload_format
         self.previous_text = ""
 
-        # Groqクライアント
-        self.client = Groq(api_key=api_key)
-        self.async_client = AsyncGroq(api_key=api_key)
+        # WAVヘッダテンプレート（44バイトのRIFFヘッダ。フォーマットは
+        # インスタンスで固定なので一度だけ構築し、チャンク毎はサイズの
+        # 2箇所をpack_intoで書き換えるだけにする）
+        self._wav_header_template = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 0, b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate,
+            sample_rate * channels * 2, channels * 2, 16,
+            b'data', 0
+        )
+
+        # Groqクライアント（クラス共有キャッシュから取得。
+        # 接続プールはGPT4oクライアントとも共有）
+        self.client = self._get_client(api_key)
+        self.async_client = self._get_async_client(api_key)
 
         # 統計情報
         self.total_requests = 0
@@ -85,28 +147,51 @@ class WhisperTranscriber:
             return "zh"
         return language
 
-    def _convert_to_wav(self, pcm_data: bytes) -> bytes:
+    def _convert_to_wav(self, pcm_data: bytes) -> tuple:
+        """
+        生のPCMデータをWAVフォーマットのアップロード用タプルに変換
+
+        Args:
+            pcm_data: 生のPCMデータ（bytes）
+
+        Returns:
+            (ファイル名, ストリーム, MIMEタイプ) のタプル。
+            SDK/httpxがマルチパート本文として直接読み出せる形式
         """
-        生のPCMデータをWAVフォーマットに変換
+        # 事前構築したヘッダテンプレートにデータ長を書き込む
+        # （waveモジュール経由のヘッダ生成・ディスパッチを省く）
+        header = bytearray(self._wav_header_template)
+        n = len(pcm_data)
+        struct.pack_into('<I', header, 4, 36 + n)   # RIFFチャンクサイズ
+        struct.pack_into('<I', header, 40, n)       # dataチャンクサイズ
+
+        # ヘッダ+PCMの連結コピー（チャンクあたり約2MB）を作らず、
+        # memoryview越しに逐次読み出すストリームとして渡す
+        return ("audio.wav", StreamingWavFile(bytes(header), pcm_data), "audio/wav")
+
+    def _encode_audio(self, pcm_data: bytes) -> tuple:
+        """
+        アップロード形式に応じてPCMデータをエンコード
 
         Args:
             pcm_data: 生のPCMデータ（bytes）
 
         Returns:
-            WAVフォーマットの音声データ
+            (ファイル名, エンコード済みバイト列, MIMEタイプ) のタプル
         """
-        wav_buffer = io.BytesIO()
-        try:
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(self.channels)
-                wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-                wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(pcm_data)
-
-            # getvalue()はread()よりもメモリ効率的
-            return wav_buffer.getvalue()
-        finally:
-            wav_buffer.close()
+        if self.upload_format == "flac":
+            samples = np.frombuffer(pcm_data, dtype=np.int16)
+            if self.channels > 1:
+                samples = samples.reshape(-1, self.channels)
+
+            flac_buffer = io.BytesIO()
+            _soundfile.write(
+                flac_buffer, samples, self.sample_rate,
+                format="FLAC", subtype="PCM_16"
+            )
+            return ("audio.flac", flac_buffer.getvalue(), "audio/flac")
+
+        return self._convert_to_wav(pcm_data)
 
     def transcribe(
         self,
@@ -123,20 +208,26 @@ class WhisperTranscriber:
         Returns:
             文字起こし結果のテキスト
         """
+        # プロンプト構築（リトライ間で変わらないためループ外で行う）
+        prompt = self.prompt_template if self.prompt_template else ""
+        if self.use_context and self.previous_text:
+            context = self.previous_text  # 保存時点で50文字に丸め済み
+            prompt = f"{prompt}\n前の発話: {context}" if prompt else f"前の発話: {context}"
+
+        # 同一音声・同一条件の結果はキャッシュから返す（再アップロード・再課金を回避）
+        cache_key = result_cache.make_key(
+            audio_chunk, self.model_name, self.language, prompt
+        )
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Transcription cache hit at {timestamp:.2f}s")
+            self.previous_text = cached[-50:]
+            return cached
+
         for attempt in range(self.max_retries):
             try:
-                # PCMデータをWAVフォーマットに変換
-                wav_data = self._convert_to_wav(audio_chunk)
-
-                # 音声データをファイルライクオブジェクトに変換
-                audio_file = io.BytesIO(wav_data)
-                audio_file.name = "audio.wav"  # ファイル名が必要
-
-                # プロンプト構築
-                prompt = self.prompt_template if self.prompt_template else ""
-                if self.use_context and self.previous_text:
-                    context = self.previous_text[-50:]  # 最後の50文字
-                    prompt = f"{prompt}\n前の発話: {context}" if prompt else f"前の発話: {context}"
+                # PCMデータをWAVフォーマットに変換（アップロード用タプルをそのまま取得）
+                audio_file = self._encode_audio(audio_chunk)
 
                 # Whisper API呼び出し
                 api_params = {
@@ -160,8 +251,9 @@ class WhisperTranscriber:
                     text = response.text.strip() if hasattr(response, "text") else ""
 
                 if text:
-                    # 前チャンクとして保存
-                    self.previous_text = text
+                    # 前チャンクとして保存し、結果をキャッシュ
+                    self.previous_text = text[-50:]
+                    result_cache.put(cache_key, text)
                     logger.info(
                         f"Transcription success: {len(text)} chars at {timestamp:.2f}s"
                     )
@@ -195,6 +287,125 @@ class WhisperTranscriber:
 
         return None
 
+    def transcribe_batch(
+        self,
+        chunks: List[bytes],
+        timestamps: Optional[List[float]] = None
+    ) -> List[Optional[str]]:
+        """
+        複数の音声チャンクを1回のAPI呼び出しでまとめて文字起こし
+
+        チャンクを連結した1つのWAVとして送信し、verbose_jsonの
+        セグメント開始時刻を連結時の境界と突き合わせて元のチャンク毎の
+        テキストに振り分ける。リクエスト毎のTLS確立やキューイングの
+        オーバーヘッドがバッチ全体で償却されるため、キューにチャンクが
+        滞留した際の追い上げに有効。
+
+        Args:
+            chunks: 音声データ（bytes）のリスト
+            timestamps: 各チャンクのタイムスタンプ（秒、ログ用）
+
+        Returns:
+            chunksと同じ順序の文字起こし結果のリスト（失敗・無音はNone）
+        """
+        if not chunks:
+            return []
+
+        # 上限を超えるバッチはmax_batch_size毎に分割して処理
+        if len(chunks) > self.max_batch_size:
+            results: List[Optional[str]] = []
+            for i in range(0, len(chunks), self.max_batch_size):
+                sub_ts = timestamps[i:i + self.max_batch_size] if timestamps else None
+                results.extend(
+                    self.transcribe_batch(chunks[i:i + self.max_batch_size], sub_ts)
+                )
+            return results
+
+        # 連結WAV内での各チャンクの開始秒（セグメント振り分け用の境界）
+        bytes_per_sec = 2 * self.sample_rate * self.channels
+        boundaries: List[float] = []
+        offset = 0.0
+        for chunk in chunks:
+            boundaries.append(offset)
+            offset += len(chunk) / bytes_per_sec
+
+        for attempt in range(self.max_retries):
+            try:
+                # 連結したPCMデータを1つのWAVに変換
+                audio_file = self._encode_audio(b"".join(chunks))
+
+                # セグメント時刻が必要なのでverbose_jsonで呼び出す
+                response = self.client.audio.transcriptions.create(
+                    model=self.model_name,
+                    file=audio_file,
+                    language=self.language,
+                    temperature=self.temperature,
+                    response_format="verbose_json"
+                )
+
+                self.total_requests += 1
+
+                results = [None] * len(chunks)
+                segments = getattr(response, "segments", None) or []
+
+                if not segments:
+                    # セグメント情報がない場合は全文を先頭チャンクに割り当て
+                    text = (getattr(response, "text", "") or "").strip()
+                    results[0] = text or None
+                    return results
+
+                # 各セグメントを開始時刻が属するチャンクに振り分け
+                parts: List[List[str]] = [[] for _ in chunks]
+                for segment in segments:
+                    if isinstance(segment, dict):
+                        start = segment.get("start", 0.0)
+                        seg_text = segment.get("text", "")
+                    else:
+                        start = getattr(segment, "start", 0.0)
+                        seg_text = getattr(segment, "text", "")
+
+                    seg_text = seg_text.strip() if seg_text else ""
+                    if not seg_text:
+                        continue
+
+                    idx = bisect.bisect_right(boundaries, start) - 1
+                    parts[idx].append(seg_text)
+
+                for i, texts in enumerate(parts):
+                    if texts:
+                        results[i] = " ".join(texts)
+
+                total_chars = sum(len(t) for t in results if t)
+                logger.info(
+                    f"Batch transcription success: {len(chunks)} chunks, {total_chars} chars"
+                )
+                return results
+
+            except httpx.HTTPStatusError as e:
+                self.total_errors += 1
+                if e.response.status_code == 429:  # Rate limit
+                    wait_time = 2 ** attempt  # 指数バックオフ
+                    logger.warning(
+                        f"Rate limit exceeded, retrying in {wait_time}s "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    time.sleep(wait_time)
+                else:
+                    logger.error(f"HTTP error {e.response.status_code}: {e}")
+                    if attempt == self.max_retries - 1:
+                        return [None] * len(chunks)
+
+            except Exception as e:
+                self.total_errors += 1
+                logger.error(
+                    f"Batch transcription error (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt == self.max_retries - 1:
+                    return [None] * len(chunks)
+                time.sleep(1)
+
+        return [None] * len(chunks)
+
     async def transcribe_async(
         self,
         audio_chunk: bytes,
@@ -212,12 +423,8 @@ class WhisperTranscriber:
         """
         for attempt in range(self.max_retries):
             try:
-                # PCMデータをWAVフォーマットに変換
-                wav_data = self._convert_to_wav(audio_chunk)
-
-                # 音声データをファイルライクオブジェクトに変換
-                audio_file = io.BytesIO(wav_data)
-                audio_file.name = "audio.wav"
+                # PCMデータをWAVフォーマットに変換（アップロード用タプルをそのまま取得）
+                audio_file = self._encode_audio(audio_chunk)
 
                 # Whisper API呼び出し（非同期）
                 response = await self.async_client.audio.transcriptions.create(
@@ -270,6 +477,46 @@ class WhisperTranscriber:
 
         return None
 
+    async def transcribe_many_async(
+        self,
+        chunks: List[bytes],
+        timestamps: List[float],
+        max_concurrent: Optional[int] = None
+    ) -> list:
+        """
+        複数チャンクを並行して非同期文字起こし
+
+        セマフォで同時リクエスト数を制限しつつasyncio.gatherで
+        ファンアウトする。上限を指定しない場合は共有レートリミッタの
+        AIMD制御値（429で半減・成功で回復）に従う。結果は入力と同じ
+        順序で返るため、呼び出し側の順序保証はそのまま維持される。
+
+        Args:
+            chunks: 音声データ（bytes）のリスト
+            timestamps: 各チャンクのタイムスタンプ（秒）
+            max_concurrent: 同時実行するリクエストの上限（Noneで自動制御）
+
+        Returns:
+            chunksと同じ順序の結果リスト（失敗した要素は例外オブジェクト）
+        """
+        limiter = get_rate_limiter()
+        if max_concurrent is None:
+            max_concurrent = limiter.limit
+        sem = asyncio.Semaphore(max_concurrent)
+
+        async def one(chunk: bytes, ts: float):
+            async with sem:
+                # Retry-Afterによる送信保留を尊重してから投げる
+                delay = limiter.wait_time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                return await self.transcribe_async(chunk, ts)
+
+        return await asyncio.gather(
+            *(one(c, t) for c, t in zip(chunks, timestamps)),
+            return_exceptions=True
+        )
+
     def get_stats(self) -> dict:
         """
         統計情報を取得
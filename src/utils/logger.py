@@ -35,6 +35,10 @@ def setup_logger(log_file: str = "logs/app.log", level: str = "INFO",
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
     # ファイル出力設定（ローテーション付き）
+    # enqueue=True: ログレコードをキュー経由でバックグラウンドスレッドが
+    # ディスクへ書き出すため、文字起こしワーカーがディスクI/Oや
+    # ローテーションでブロックしない。catch=True: シンク内の例外で
+    # アプリ本体を落とさない
     logger.add(
         log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
@@ -42,12 +46,27 @@ def setup_logger(log_file: str = "logs/app.log", level: str = "INFO",
         rotation=f"{max_size_mb} MB",
         retention=backup_count,
         compression="zip",
-        encoding="utf-8"
+        encoding="utf-8",
+        enqueue=True,
+        catch=True
     )
 
     logger.info(f"Logger initialized: level={level}, file={log_file}")
 
 
+def shutdown_logger() -> None:
+    """
+    終了時にキュー内のログレコードをすべて書き出す
+
+    enqueue=Trueのファイルシンクは非同期に書き込まれるため、
+    アプリ終了前に呼んで未書き込み分をフラッシュする。
+    """
+    try:
+        logger.complete()
+    except Exception:
+        pass
+
+
 def get_logger(name: str = __name__):
     """
     ロガーインスタンスを取得
@@ -62,4 +81,4 @@ def get_logger(name: str = __name__):
 
 
 # モジュールレベルでのエクスポート
-__all__ = ["setup_logger", "get_logger", "logger"]
+__all__ = ["setup_logger", "shutdown_logger", "get_logger", "logger"]
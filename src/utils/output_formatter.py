@@ -8,6 +8,23 @@ from typing import Dict, List
 from pathlib import Path
 from src.utils.logger import logger
 
+# orjson（C実装のJSONシリアライザ）があれば使用し、なければ標準のjsonで処理
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Markdown出力テンプレート（逐次連結による再確保を避け、1回のformatで組み立てる）
+_MD_TEMPLATE = (
+    "# {title}\n\n"
+    "**日時**: {date}\n\n"
+    "{duration_line}"
+    "{model_line}"
+    "---\n\n"
+    "## 内容\n\n"
+    "{body}\n"
+)
+
 
 class OutputFormatter:
     """出力フォーマッタークラス"""
@@ -49,20 +66,13 @@ class OutputFormatter:
             duration = metadata.get("duration", "")
             model = metadata.get("model", "")
 
-            markdown = f"# {title}\n\n"
-            markdown += f"**日時**: {date_str}\n\n"
-
-            if duration:
-                markdown += f"**録音時間**: {duration}\n\n"
-
-            if model:
-                markdown += f"**文字起こしモデル**: {model}\n\n"
-
-            markdown += "---\n\n"
-            markdown += "## 内容\n\n"
-            markdown += transcript_text + "\n"
-
-            return markdown
+            return _MD_TEMPLATE.format(
+                title=title,
+                date=date_str,
+                duration_line=f"**録音時間**: {duration}\n\n" if duration else "",
+                model_line=f"**文字起こしモデル**: {model}\n\n" if model else "",
+                body=transcript_text,
+            )
         return f"## 内容\n\n{transcript_text}\n"
 
     @staticmethod
@@ -84,6 +94,10 @@ class OutputFormatter:
             "chunks": chunks or []
         }
 
+        # チャンク数が多い長時間会議ではシリアライズが重くなるため、
+        # orjsonがあればそちらを使う（非ASCIIはネイティブ対応）
+        if _orjson is not None:
+            return _orjson.dumps(output, option=_orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(output, ensure_ascii=False, indent=2)
 
     @staticmethod
@@ -109,9 +123,10 @@ class OutputFormatter:
             # ディレクトリが存在しない場合は作成
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # ファイルに書き込み
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # 一括エンコードしてバイト列で書き込み
+            # （テキストモードのエンコーダ経由の逐次書き込みを避け、
+            #   数MBの出力でも1回の書き込みで済む）
+            path.write_bytes(content.encode("utf-8"))
 
             logger.info(f"Saved to {path}")
 
@@ -125,9 +140,24 @@ class TranscriptBuilder:
 
     def __init__(self):
         """初期化"""
-        self.text = ""
+        self._parts = []  # チャンク毎の確定テキスト
+        self._text_cache = None  # 結合済み全文のキャッシュ（add_chunkで無効化）
         self.chunks = []
         self.start_time = None
+        self._partial_parts = []  # ストリーミング中の未確定テキスト
+
+    @property
+    def text(self) -> str:
+        """
+        結合済みの文字起こし全文
+
+        リストに溜めたチャンクを参照時にjoinで結合する
+        （チャンク毎の文字列連結による再確保を避ける）。
+        結果は次のadd_chunkまでキャッシュされる。
+        """
+        if self._text_cache is None:
+            self._text_cache = " ".join(self._parts)
+        return self._text_cache
 
     def add_chunk(self, text: str, timestamp: float = 0.0) -> None:
         """
@@ -140,24 +170,44 @@ class TranscriptBuilder:
         if not self.start_time:
             self.start_time = datetime.datetime.now()
 
-        # テキストを連続して追加
-        formatted_text = text if not self.text else " " + text
-        self.text += formatted_text
+        # 確定テキストが来たら未確定分は破棄（add_chunkのtextに全文が含まれる）
+        self._partial_parts = []
 
-        # チャンク情報を保存（テキスト本体は self.text に保存済み）
+        # テキストはリストに追加し、結合は参照時まで遅延
+        self._parts.append(text)
+        self._text_cache = None
+
+        # チャンク情報を保存（テキスト本体は self._parts に保存済み）
         self.chunks.append({
             "timestamp": timestamp,
             "length": len(text)
         })
 
+    def append_partial(self, delta: str) -> None:
+        """
+        ストリーミング中の部分テキストを追加
+
+        チャンク情報には登録せず、確定テキストがadd_chunkで
+        届いた時点で未確定分は置き換えられる。
+
+        Args:
+            delta: 部分テキスト（デルタ）
+        """
+        if not self.start_time:
+            self.start_time = datetime.datetime.now()
+        self._partial_parts.append(delta)
+
     def get_text(self) -> str:
         """
-        文字起こしテキストを取得
+        文字起こしテキストを取得（ストリーミング中の未確定分を含む）
 
         Returns:
             文字起こしテキスト
         """
-        return self.text
+        if not self._partial_parts:
+            return self.text
+        partial = "".join(self._partial_parts)
+        return f"{self.text} {partial}" if self.text else partial
 
     def get_metadata(self, title: str = "議事録", model: str = "", duration: str = "") -> Dict:
         """
@@ -191,6 +241,8 @@ class TranscriptBuilder:
 
     def clear(self) -> None:
         """クリア"""
-        self.text = ""
+        self._parts = []
+        self._text_cache = None
         self.chunks = []
         self.start_time = None
+        self._partial_parts = []